@@ -1,4 +1,7 @@
-from multicrypto.ellipticcurve import secp256k1
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+from multicrypto.ellipticcurve import Point, secp256k1
 
 from multicrypto.base58 import (
     bytes_to_base58,
@@ -7,11 +10,29 @@ from multicrypto.base58 import (
     validate_base58,
     base58,
 )
-from multicrypto.bech32 import encode
+from multicrypto.bech32 import CHARSET, encode
 from multicrypto.coins import coins
-from multicrypto.utils import double_sha256, encode_point, hash160
+from multicrypto.utils import double_sha256, encode_point, hash160, hash160_many
 
 G = secp256k1.G  # generator point
+DERIVATION_BATCH_SIZE = 1024  # number of keys sharing one modular inversion
+P2WPKH_WITNESS_VERSION = 0  # public key hash witness programs are defined only for version 0
+PUBLIC_KEY_CACHE_SIZE = 1024  # number of private keys with cached public key data
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def derive_public_key_data(private_key):
+    """
+    Derive public key together with its encodings and hashes. Results for recently used
+    private keys are cached, so many inputs spent by the same key derive it only once.
+    :param private_key: Private key (int)
+    :return: Tuple (public key, encoded public keys, public key hashes), encodings and hashes
+             are pairs (uncompressed, compressed) which can be indexed by compressed flag
+    """
+    public_key = G * private_key
+    encoded_public_keys = (encode_point(public_key, False), encode_point(public_key, True))
+    public_key_hashes = tuple(hash160(encoded) for encoded in encoded_public_keys)
+    return public_key, encoded_public_keys, public_key_hashes
 
 
 def convert_private_key_to_address(private_key, addr_prefix_bytes, compressed=True, segwit=False):
@@ -19,6 +40,62 @@ def convert_private_key_to_address(private_key, addr_prefix_bytes, compressed=Tr
     return convert_public_key_to_address(public_key, addr_prefix_bytes, compressed, segwit)
 
 
+def derive_public_keys(private_keys, batch_size=DERIVATION_BATCH_SIZE, curve=secp256k1):
+    """
+    Generate public keys for many private keys. Multiplications use fixed-base table of
+    the generator and results of every batch are normalised with one modular inversion.
+    :param private_keys: Iterable of private keys (int)
+    :param batch_size: Number of keys processed at once
+    :param curve: Elliptic curve
+    :return: Generator of public keys in the same order as private keys
+    """
+    batch = []
+    for private_key in private_keys:
+        batch.append(curve.jacobian_multiply_generator(private_key))
+        if len(batch) == batch_size:
+            for x, y in curve.to_affine_coordinates(batch):
+                yield Point.from_trusted(curve, x, y)
+            batch = []
+    for x, y in curve.to_affine_coordinates(batch):
+        yield Point.from_trusted(curve, x, y)
+
+
+def derive_addresses(
+    private_keys, coin, compressed=True, segwit=False, batch_size=DERIVATION_BATCH_SIZE
+):
+    """
+    Generate addresses for many private keys, public keys of every batch are hashed at once.
+    :param private_keys: Iterable of private keys (int)
+    :param coin: Coin settings
+    :param compressed: Use compressed public keys
+    :param segwit: Generate segwit (P2SH-P2WPKH) addresses
+    :param batch_size: Number of keys processed at once
+    :return: Generator of addresses in the same order as private keys
+    """
+    prefix_bytes = coin['script_prefix_bytes'] if segwit else coin['address_prefix_bytes']
+    batch = []
+    for public_key in derive_public_keys(private_keys, batch_size):
+        batch.append(encode_point(public_key, compressed))
+        if len(batch) == batch_size:
+            yield from calculate_addresses(batch, prefix_bytes, segwit)
+            batch = []
+    yield from calculate_addresses(batch, prefix_bytes, segwit)
+
+
+def calculate_addresses(encoded_public_keys, address_prefix_bytes, segwit=False):
+    """
+    Calculate addresses for many encoded public keys hashing them in one batch.
+    :param encoded_public_keys: List of encoded public keys (bytes)
+    :param address_prefix_bytes: Address prefix bytes
+    :param segwit: Calculate segwit (P2SH-P2WPKH) addresses
+    :return: List of addresses
+    """
+    digests = hash160_many(encoded_public_keys)
+    if segwit:
+        digests = hash160_many([b'\x00\x14' + digest for digest in digests])
+    return [calculate_address(digest, address_prefix_bytes) for digest in digests]
+
+
 def convert_wif_private_key_to_address(wif_private_key, address_prefix_bytes, segwit=False):
     private_key, compressed = get_private_key_from_wif_format(wif_private_key)
     address = convert_private_key_to_address(private_key, address_prefix_bytes, compressed, segwit)
@@ -47,6 +124,10 @@ def decompose_address(address, coin):
 
 def calculate_public_key_hash(public_key, compressed=True, segwit=False):
     encoded_public_key = encode_point(public_key, compressed)
+    return calculate_encoded_public_key_hash(encoded_public_key, segwit)
+
+
+def calculate_encoded_public_key_hash(encoded_public_key, segwit=False):
     digest = hash160(encoded_public_key)
     if segwit:
         redeem_script = b'\x00\x14' + digest
@@ -115,12 +196,12 @@ def get_address_range(address_prefix_bytes):
 
 
 def validate_pattern(pattern, coin_symbol, is_script):
+    """Check that some address digest produces address starting with the pattern"""
     validate_base58(pattern)
-    if is_script:
-        start_address, end_address = get_address_range(coins[coin_symbol]['script_prefix_bytes'])
-    else:
-        start_address, end_address = get_address_range(coins[coin_symbol]['address_prefix_bytes'])
-    if not start_address[: len(pattern)] <= pattern <= end_address[: len(pattern)]:
+    coin = coins[coin_symbol]
+    prefix_bytes = coin['script_prefix_bytes'] if is_script else coin['address_prefix_bytes']
+    if not get_pattern_digest_ranges(pattern, prefix_bytes):
+        start_address, end_address = get_address_range(prefix_bytes)
         raise ValueError(
             f'Impossible prefix! Choose different one from {start_address}-{end_address} range'
             f'(characters order is {base58})'
@@ -128,6 +209,172 @@ def validate_pattern(pattern, coin_symbol, is_script):
     return True
 
 
+def calculate_bech32_address(digest, bech32_hrp):
+    """Calculate native segwit (P2WPKH) address from public key hash"""
+    return encode(bech32_hrp, P2WPKH_WITNESS_VERSION, list(digest))
+
+
+def validate_bech32_pattern(pattern, coin_symbol):
+    bech32_hrp = coins[coin_symbol].get('bech32_hrp')
+    if not bech32_hrp:
+        raise ValueError(f'Coin {coin_symbol} does not support bech32 addresses')
+    address_prefix = f'{bech32_hrp}1{CHARSET[P2WPKH_WITNESS_VERSION]}'
+    if not pattern.startswith(address_prefix):
+        raise ValueError(f'Bech32 address must start with {address_prefix}')
+    data = pattern[len(address_prefix) :]
+    if len(data) > 32 or not all(character in CHARSET for character in data):
+        raise ValueError(
+            f'Impossible prefix! After {address_prefix} at most 32 characters '
+            f'from {CHARSET} are allowed'
+        )
+    return True
+
+
+def get_bech32_pattern_digest_ranges(pattern, bech32_hrp):
+    """
+    Calculate range of public key hashes (as integers) of native segwit addresses starting
+    with pattern. Every data character encodes 5 bits of the hash, so the range is exact.
+    :param pattern: Address prefix including human readable part and witness version
+    :param bech32_hrp: Human readable part of addresses
+    :return: List with pair (start, end) of the range, end is excluded
+    """
+    data = pattern[len(bech32_hrp) + 2 :]
+    value = 0
+    for character in data:
+        value = value << 5 | CHARSET.index(character)
+    shift = 160 - 5 * len(data)
+    return [(value << shift, (value + 1) << shift)]
+
+
+def get_pattern_digest_ranges(pattern, address_prefix_bytes):
+    """
+    Calculate ranges of address digests (hash160 as integer) for which base58 address with
+    given prefix bytes starts with the pattern. Because the checksum is not known in advance,
+    digests on the borders of the ranges could still produce not matching address.
+    :param pattern: Address prefix
+    :param address_prefix_bytes: Address prefix bytes of the coin
+    :return: List of (start, end) ranges, start inclusive and end exclusive
+    """
+    digest_size = 20
+    data_size = len(address_prefix_bytes) + digest_size + 4
+    base = int.from_bytes(address_prefix_bytes, byteorder='big') << (8 * (digest_size + 4))
+    leading_ones = len(pattern) - len(pattern.lstrip('1'))
+    if leading_ones >= data_size:
+        return []  # address data is too short to start with so many zero bytes
+    pattern_value = base58_to_int(pattern[leading_ones:])
+    pattern_length = len(pattern) - leading_ones
+    # every leading '1' character in address is encoded as zero byte
+    low = 256 ** (data_size - leading_ones - 1) if pattern_length else 0
+    high = 256 ** (data_size - leading_ones)
+    if pattern_length:
+        value_ranges = []
+        digits_number = pattern_length
+        while pattern_value * 58 ** (digits_number - pattern_length) < high:
+            shift = 58 ** (digits_number - pattern_length)
+            value_ranges.append((pattern_value * shift, (pattern_value + 1) * shift))
+            digits_number += 1
+    else:
+        value_ranges = [(low, high)]
+    digest_ranges = []
+    for start, end in value_ranges:
+        start = max(start, low, base)
+        end = min(end, high, base + (1 << (8 * (digest_size + 4))))
+        if start < end:
+            digest_ranges.append(((start - base) >> 32, ((end - 1 - base) >> 32) + 1))
+    return digest_ranges
+
+
+class PatternIndex:
+    def __init__(self, patterns, address_prefix_bytes=None, bech32_hrp=None):
+        """
+        Index of address patterns allowing to check many patterns at once. Patterns are
+        stored in prefix tree and, when address prefix bytes (or human readable part of bech32
+        addresses) are known, also compiled to sorted ranges of digests, so most of the
+        addresses can be rejected by comparing integers, without calculating checksum
+        and encoding.
+        :param patterns: Iterable of address prefixes
+        :param address_prefix_bytes: Address prefix bytes of the coin
+        :param bech32_hrp: Human readable part of native segwit addresses
+        """
+        self.patterns = sorted(set(patterns))
+        self.tree = {}
+        for pattern in self.patterns:
+            node = self.tree
+            for character in pattern:
+                node = node.setdefault(character, {})
+            node[None] = pattern  # pattern ends in this node
+        self.boundaries = []
+        self.segments_patterns = []
+        if address_prefix_bytes is not None:
+            self.add_digest_ranges(
+                [
+                    (start, end, pattern)
+                    for pattern in self.patterns
+                    for start, end in get_pattern_digest_ranges(pattern, address_prefix_bytes)
+                ]
+            )
+        elif bech32_hrp is not None:
+            self.add_digest_ranges(
+                [
+                    (start, end, pattern)
+                    for pattern in self.patterns
+                    for start, end in get_bech32_pattern_digest_ranges(pattern, bech32_hrp)
+                ]
+            )
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def add_digest_ranges(self, digest_ranges):
+        """
+        Split digest ranges (start, end, pattern) to disjoint segments, each segment keeps
+        patterns which could match digests from the segment.
+        """
+        self.boundaries = sorted(
+            {boundary for start, end, _ in digest_ranges for boundary in (start, end)}
+        )
+        self.segments_patterns = [[] for _ in self.boundaries]
+        for start, end, pattern in digest_ranges:
+            for i in range(bisect_left(self.boundaries, start), bisect_left(self.boundaries, end)):
+                self.segments_patterns[i].append(pattern)
+
+    def match_probability(self):
+        """
+        Approximate probability that address with random digest matches one of the patterns,
+        calculated as width of union of digest ranges (requires address prefix bytes).
+        """
+        width = sum(
+            end - start
+            for start, end, patterns in zip(
+                self.boundaries, self.boundaries[1:], self.segments_patterns
+            )
+            if patterns
+        )
+        return width / 2**160
+
+    def match(self, address):
+        """Return list of patterns which are prefixes of the address"""
+        node = self.tree
+        matched_patterns = [node[None]] if None in node else []
+        for character in address:
+            node = node.get(character)
+            if node is None:
+                break
+            if None in node:
+                matched_patterns.append(node[None])
+        return matched_patterns
+
+    def match_digest(self, digest):
+        """
+        Return list of patterns which could be prefixes of the address with given digest
+        (as integer). Empty list means that none of the patterns matches.
+        """
+        i = bisect_right(self.boundaries, digest) - 1
+        if i < 0:
+            return []
+        return self.segments_patterns[i]
+
+
 def validate_address(address, coin_symbol):
     address_bytes = base58_to_bytes(address)
     coin = coins[coin_symbol]
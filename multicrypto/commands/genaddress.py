@@ -1,60 +1,488 @@
 import argparse
 import datetime
+import json
 import logging
 import multiprocessing
+import os
+import queue
+import signal
 import sys
+import time
+from functools import partial
 
-from multicrypto.ellipticcurve import secp256k1
+from multicrypto.ellipticcurve import secp256k1, WALK_BATCH_SIZE
 
 from multicrypto.address import (
-    convert_public_key_to_address,
+    calculate_address,
+    calculate_bech32_address,
+    calculate_encoded_public_key_hash,
     convert_private_key_to_wif_format,
+    validate_bech32_pattern,
     validate_pattern,
+    PatternIndex,
 )
 from multicrypto.coins import coins
 from multicrypto.scripts import validate_hex_script, convert_script_to_p2sh_address
-from multicrypto.utils import save_qrcode
+from multicrypto.utils import encode_coordinates, save_qrcode
 from multicrypto.validators import check_coin_symbol
 
 logger = logging.getLogger(__name__)
 N = secp256k1.n  # order of the curve
 G = secp256k1.G  # generator point
+CHECKPOINT_INTERVAL = 10000000  # number of keys checked between checkpoints
+STATS_INTERVAL = 60  # seconds between reports of workers statistics
+CALIBRATION_KEYS = 4 * WALK_BATCH_SIZE  # number of keys checked by the calibration benchmark
+JOIN_TIMEOUT = 10  # seconds given to a worker to finish before it is terminated
+POLL_INTERVAL = 1  # seconds between checks whether workers are still running
 
 
-def generate_address(worker_num, coin_settings, pattern, compressed, segwit, out_dir, found, stop):
-    if segwit:
-        prefix_bytes = coin_settings['script_prefix_bytes']
-    else:
-        prefix_bytes = coin_settings['address_prefix_bytes']
+def report_address(address, wif_private_key, out_dir, results=None, verbose=False):
+    if results is not None:
+        results.put((address, wif_private_key))
+    if out_dir:
+        save_qrcode(address, out_dir, error_correct='L')
+        if wif_private_key:
+            save_qrcode(wif_private_key, out_dir, f'{address}_private_key.png')
+    if not verbose:
+        return
+    print(f'Address: {address}\nPrivate key: {wif_private_key}')
+    if out_dir:
+        print(f'QR codes were saved in directory {out_dir}')
+    sys.stdout.flush()
+
+
+def read_checkpoint(checkpoint_file, start, stride):
+    """
+    Read position of the worker from checkpoint file.
+    :param checkpoint_file: Path to checkpoint file
+    :param start: First private key of the worker or None if it should be taken from checkpoint
+    :param stride: Difference between consecutive private keys checked by the worker
+    :return: Pair (start, offset) where offset is number of keys already checked
+    """
+    if not checkpoint_file or not os.path.isfile(checkpoint_file):
+        return start, 0
+    with open(checkpoint_file) as f:
+        checkpoint = json.load(f)
+    if checkpoint['stride'] != stride or start is not None and checkpoint['start'] != start:
+        raise ValueError(
+            f'Checkpoint {checkpoint_file} was created for different keyspace partitioning'
+        )
+    return checkpoint['start'], checkpoint['offset']
+
+
+def write_checkpoint(checkpoint_file, start, stride, offset):
+    """
+    Atomically save position of the worker. Checkpoint contains enough information to
+    recover private keys of found addresses and must be kept secret, so the file is readable
+    only by its owner.
+    """
+    temp_file = checkpoint_file + '.tmp'
+    with open(os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+        json.dump({'start': start, 'stride': stride, 'offset': offset}, f)
+    os.replace(temp_file, checkpoint_file)
+
+
+def create_pattern_index(coin_settings, patterns, segwit=False, bech32=False):
+    """
+    Create index of patterns for the address type together with function converting
+    public key hash to address.
+    :return: Pair (pattern index, function calculating address from digest)
+    """
+    if bech32:
+        bech32_hrp = coin_settings['bech32_hrp']
+        return (
+            PatternIndex(patterns, bech32_hrp=bech32_hrp),
+            partial(calculate_bech32_address, bech32_hrp=bech32_hrp),
+        )
+    prefix_bytes = coin_settings['script_prefix_bytes' if segwit else 'address_prefix_bytes']
+    return (
+        PatternIndex(patterns, prefix_bytes),
+        partial(calculate_address, address_prefix_bytes=prefix_bytes),
+    )
+
+
+def generate_address(
+    worker_num,
+    coin_settings,
+    pattern,
+    compressed,
+    segwit,
+    out_dir,
+    found,
+    stop,
+    start=None,
+    stride=1,
+    checkpoint_file=None,
+    checkpoint_interval=CHECKPOINT_INTERVAL,
+    counters=None,
+    results=None,
+    bech32=False,
+    stop_on_first=None,
+    verbose=False,
+):
+    """
+    Search for addresses starting with pattern. When list of patterns is provided, all of
+    them are checked against every generated address and the search continues after a hit
+    (reporting every found address) until stop is set.
+    With stop_on_first flag the search ends at the first found address, by default only
+    when single pattern is given as string.
+    Worker checks private keys start, start + stride, start + 2 * stride, ... where start
+    is random when not provided. Position is periodically saved to checkpoint file
+    and the search is resumed from it when the file already exists.
+    Number of checked keys is published in counters[worker_num] (shared array) for statistics
+    and found pairs (address, wif private key) are put to results queue.
+    With bech32 flag native segwit (P2WPKH) addresses are searched. Found addresses and
+    private keys are printed only with verbose flag.
+    :return: Last found pair (address, wif private key) or None
+    """
     secret_prefix_bytes = coin_settings['secret_prefix_bytes']
-    seed = secp256k1.gen_private_key()
-    point = seed * G
-    counter = 0
-    start_time = datetime.datetime.now()
-    while not stop.is_set():
-        address = convert_public_key_to_address(point, prefix_bytes, compressed, segwit)
-        if address.startswith(pattern):
-            private_key = (seed + counter) % N
+    pattern_index, calculate_digest_address = create_pattern_index(
+        coin_settings, [pattern] if isinstance(pattern, str) else pattern, segwit, bech32
+    )
+    if stop_on_first is None:
+        stop_on_first = isinstance(pattern, str)
+    result = None
+    start, offset = read_checkpoint(checkpoint_file, start, stride)
+    if start is None:
+        start = secp256k1.gen_private_key()
+    seed = (start + offset * stride) % N
+    for counter, (x, y) in enumerate(secp256k1.walk_points(seed * G, stride * G)):
+        stopped = counter % WALK_BATCH_SIZE == 0 and stop.is_set()
+        if counters is not None and counter % WALK_BATCH_SIZE == 0:
+            counters[worker_num] = counter
+        if checkpoint_file and (stopped or counter % checkpoint_interval == 0):
+            write_checkpoint(checkpoint_file, start, stride, offset + counter)
+        if stopped:
+            break
+        encoded_public_key = encode_coordinates(x, y, compressed)
+        digest = calculate_encoded_public_key_hash(encoded_public_key, segwit)
+        if not pattern_index.match_digest(int.from_bytes(digest, byteorder='big')):
+            continue
+        address = calculate_digest_address(digest)
+        if pattern_index.match(address):
+            private_key = (seed + counter * stride) % N
             wif_private_key = convert_private_key_to_wif_format(
                 private_key, secret_prefix_bytes, compressed
             )
-            print(f'Address: {address}\nPrivate key: {wif_private_key}')
-            if out_dir:
-                save_qrcode(address, out_dir, error_correct='L')
-                if wif_private_key:
-                    save_qrcode(wif_private_key, out_dir, f'{address}_private_key.png')
-                print(f'QR codes were saved in directory {out_dir}')
-            found.set()
-            stop.set()
-            return address, wif_private_key
-        point += G
-        counter += 1
-        if counter % 10000000 == 0:
-            print(
-                f'worker: {worker_num}, checked {counter / 1000000}M addresses '
-                f'({counter // (datetime.datetime.now() - start_time).seconds}/sec)'
+            report_address(address, wif_private_key, out_dir, results, verbose)
+            result = address, wif_private_key
+            if stop_on_first:
+                found.set()
+                stop.set()
+                return result
+    return result
+
+
+def measure_key_rate(pattern_index, compressed, segwit, keys=CALIBRATION_KEYS):
+    """
+    Measure how many keys per second a single worker checks, using the same steps as the search.
+    :return: Number of keys checked per second
+    """
+    points = secp256k1.walk_points(secp256k1.gen_private_key() * G, G)
+    for _ in range(WALK_BATCH_SIZE):  # precomputation and first batch are not measured
+        next(points)
+    start_time = time.perf_counter()
+    for _, (x, y) in zip(range(keys), points):
+        digest = calculate_encoded_public_key_hash(encode_coordinates(x, y, compressed), segwit)
+        pattern_index.match_digest(int.from_bytes(digest, byteorder='big'))
+    return keys / (time.perf_counter() - start_time)
+
+
+def estimate_search(pattern_index, key_rate, cores, max_time=None):
+    """
+    Print probability that a key matches one of the patterns, expected number of keys and
+    expected time of the search.
+    :param pattern_index: Index of searched patterns
+    :param key_rate: Number of keys checked per second by a single core
+    :param cores: Number of cores used by the search
+    :param max_time: Maximal accepted expected time in seconds
+    :return: Expected time of the search in seconds
+    """
+    if cores < 1 or key_rate <= 0:
+        raise ValueError('Number of cores and key rate must be positive')
+    probability = pattern_index.match_probability()
+    if not probability:
+        raise ValueError('Patterns can not be matched by any address')
+    expected_keys = 1 / probability
+    expected_time = expected_keys / (key_rate * cores)
+    print(
+        f'Probability of match: 1 in {expected_keys:,.0f}, expected time: '
+        f'{format_duration(expected_time)} using {cores} cores ({key_rate:.0f} keys/sec per core)'
+    )
+    if max_time is not None and expected_time > max_time:
+        raise ValueError(
+            f'Expected time {format_duration(expected_time)} exceeds '
+            f'maximal time {format_duration(max_time)}'
+        )
+    return expected_time
+
+
+def run_worker(target, **kwargs):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # interruption is handled by the parent process
+    target(**kwargs)
+
+
+class WorkerPool:
+    def __init__(self, target, workers_kwargs):
+        """
+        Pool of processes calling target(worker_num, found, stop, counters, results, **kwargs)
+        for every item of workers_kwargs. Workers put found pairs (address, private key) to
+        results queue and publish numbers of checked keys in counters. Pool can be used as
+        context manager which stops and joins all processes at exit.
+        :param target: Function searching for addresses
+        :param workers_kwargs: List of keyword arguments of target with one item per worker
+        """
+        self.found = multiprocessing.Event()
+        self.stop_event = multiprocessing.Event()
+        self.results = multiprocessing.Queue()
+        self.counters = multiprocessing.Array('Q', len(workers_kwargs), lock=False)  # per worker
+        self.found_addresses = []
+        self.failed_workers = set()
+        self.processes = [
+            multiprocessing.Process(
+                target=run_worker,
+                args=(target,),
+                kwargs=dict(
+                    kwargs,
+                    worker_num=i,
+                    found=self.found,
+                    stop=self.stop_event,
+                    counters=self.counters,
+                    results=self.results,
+                ),
+                daemon=True,
             )
-            sys.stdout.flush()
+            for i, kwargs in enumerate(workers_kwargs)
+        ]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        for process in self.processes:
+            process.start()
+
+    def wait(self, timeout=None):
+        """
+        Wait until single pattern is found or all workers exit, workers which failed are logged.
+        :param timeout: Maximal waiting time in seconds, None waits without limit
+        :return: False on timeout, True when the search ended
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            interval = POLL_INTERVAL if deadline is None else deadline - time.monotonic()
+            if self.found.wait(max(0, min(interval, POLL_INTERVAL))):
+                return True
+            if not self.check_workers():
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def check_workers(self):
+        """Log workers which exited with error, return number of workers still running"""
+        running = 0
+        for process in self.processes:
+            if process.is_alive():
+                running += 1
+            elif process.exitcode and process.name not in self.failed_workers:
+                self.failed_workers.add(process.name)
+                logger.error(f'Worker {process.name} exited with code {process.exitcode}')
+        return running
+
+    def collect_results(self):
+        """Return all pairs (address, wif private key) found so far"""
+        while True:
+            try:
+                self.found_addresses.append(self.results.get_nowait())
+            except queue.Empty:
+                return self.found_addresses
+
+    def stop(self, timeout=JOIN_TIMEOUT):
+        """
+        Ask workers to stop, wait for them at most timeout seconds and terminate workers
+        which did not finish.
+        :return: List of found pairs (address, wif private key)
+        """
+        self.stop_event.set()
+        deadline = time.monotonic() + timeout
+        for process in self.processes:
+            if process.pid is None:
+                continue  # not started
+            while process.is_alive() and time.monotonic() < deadline:
+                self.collect_results()  # worker exits only after its results are read
+                process.join(0.1)
+            if process.is_alive():
+                logger.warning(f'Terminating worker {process.name}')
+                process.terminate()
+                process.join()
+        return self.collect_results()
+
+
+class AddressGenerationPool(WorkerPool):
+    def __init__(
+        self,
+        coin_settings,
+        patterns,
+        compressed=True,
+        segwit=False,
+        out_dir=None,
+        keyspaces=None,
+        bech32=False,
+        stop_on_first=False,
+        verbose=False,
+    ):
+        """
+        Pool of processes searching for addresses starting with one of the patterns.
+        :param coin_settings: Coin settings
+        :param patterns: List of address patterns
+        :param compressed: Use compressed public keys
+        :param segwit: Search for segwit (P2SH-P2WPKH) addresses
+        :param out_dir: Directory where QR codes of found addresses are saved
+        :param keyspaces: List of generate_address keyword arguments (start, stride, checkpoint)
+            with one item per worker, single worker checking random keys by default
+        :param bech32: Search for native segwit (P2WPKH) addresses
+        :param stop_on_first: End the search when the first address is found
+        :param verbose: Print found addresses and private keys
+        """
+        super().__init__(
+            generate_address,
+            [
+                dict(
+                    keyspace,
+                    coin_settings=coin_settings,
+                    pattern=patterns,
+                    compressed=compressed,
+                    segwit=segwit,
+                    out_dir=out_dir,
+                    bech32=bech32,
+                    stop_on_first=stop_on_first,
+                    verbose=verbose,
+                )
+                for keyspace in keyspaces or [{}]
+            ],
+        )
+
+
+def find_addresses(
+    patterns,
+    coin_symbol,
+    cores=1,
+    compressed=True,
+    segwit=False,
+    out_dir=None,
+    timeout=None,
+    bech32=False,
+    stop_on_first=None,
+):
+    """
+    Search for addresses starting with one of the patterns using many processes. By default
+    search of single pattern ends when address is found, many patterns are searched until timeout.
+    Found private keys are only returned, nothing is printed.
+    :param patterns: List of address patterns
+    :param coin_symbol: Symbol of the coin i.e. BTC
+    :param cores: Number of worker processes
+    :param compressed: Use compressed public keys
+    :param segwit: Search for segwit (P2SH-P2WPKH) addresses
+    :param out_dir: Directory where QR codes of found addresses are saved
+    :param timeout: Maximal time of the search in seconds
+    :param bech32: Search for native segwit (P2WPKH) addresses
+    :param stop_on_first: End the search when the first address is found,
+        by default when single pattern is given
+    :return: List of found pairs (address, wif private key)
+    """
+    validate_patterns(patterns, coin_symbol, compressed, segwit, bech32)
+    pattern_index, _ = create_pattern_index(coins[coin_symbol], patterns, segwit, bech32)
+    if not pattern_index.match_probability():
+        raise ValueError('Patterns can not be matched by any address')
+    if stop_on_first is None:
+        stop_on_first = len(patterns) == 1
+    keyspaces = [{} for _ in range(cores)]
+    with AddressGenerationPool(
+        coins[coin_symbol], patterns, compressed, segwit, out_dir, keyspaces, bech32, stop_on_first
+    ) as pool:
+        pool.wait(timeout)
+    return pool.found_addresses
+
+
+def format_duration(seconds):
+    if seconds < 365 * 24 * 3600:
+        return str(datetime.timedelta(seconds=round(seconds)))
+    return f'{seconds / (365.25 * 24 * 3600):.3g} years'
+
+
+def print_stats(counters, previous_counters, elapsed_seconds, probability):
+    """
+    Print aggregated throughput of workers, expected time to the next match and skew between
+    the fastest and the slowest worker.
+    :param counters: Numbers of keys checked by workers
+    :param previous_counters: Numbers of keys checked by workers at previous report
+    :param elapsed_seconds: Seconds elapsed since previous report
+    :param probability: Probability that a single key matches pattern
+    """
+    rates = [
+        (current - previous) / elapsed_seconds
+        for current, previous in zip(counters, previous_counters)
+    ]
+    total_rate = sum(rates)
+    if total_rate and probability:
+        expected_time = format_duration(1 / (probability * total_rate))
+    else:
+        expected_time = 'unknown'
+    slowest = min(range(len(rates)), key=rates.__getitem__)
+    fastest = max(range(len(rates)), key=rates.__getitem__)
+    skew = (rates[fastest] - rates[slowest]) / (total_rate / len(rates)) if total_rate else 0
+    print(
+        f'checked {sum(counters) / 1000000:.1f}M addresses ({total_rate:.0f}/sec), '
+        f'expected time to match: {expected_time}, '
+        f'slowest worker: {slowest} ({rates[slowest]:.0f}/sec), '
+        f'fastest worker: {fastest} ({rates[fastest]:.0f}/sec), skew: {skew:.1%}'
+    )
+    sys.stdout.flush()
+
+
+def validate_stats_interval(stats_interval):
+    if stats_interval < 0:
+        raise ValueError('Statistics interval can not be negative')
+
+
+def supervise_workers(pool, stats_interval, probability):
+    """
+    Wait until address is found or all workers exit, reporting statistics of workers
+    every stats_interval seconds.
+    """
+    previous_counters = list(pool.counters)
+    previous_time = time.monotonic()
+    while not pool.wait(stats_interval or None):
+        current_counters = list(pool.counters)
+        current_time = time.monotonic()
+        print_stats(current_counters, previous_counters, current_time - previous_time, probability)
+        previous_counters, previous_time = current_counters, current_time
+
+
+def validate_patterns(patterns, coin_symbol, compressed, segwit, bech32):
+    if (segwit or bech32) and not compressed:
+        raise ValueError('Segwit addresses must used compressed public key representation')
+    if segwit and bech32:
+        raise ValueError('Choose either segwit (P2SH-P2WPKH) or bech32 (P2WPKH) addresses')
+    if not patterns:
+        raise ValueError('No patterns were provided')
+    for pattern in patterns:
+        if bech32:
+            validate_bech32_pattern(pattern, coin_symbol)
+        else:
+            validate_pattern(pattern, coin_symbol, segwit)
+
+
+def read_patterns(args):
+    patterns = [args.pattern] if args.pattern or not args.patterns_file else []
+    if args.patterns_file:
+        with open(args.patterns_file) as patterns_file:
+            patterns.extend(line.strip() for line in patterns_file if line.strip())
+    return patterns
 
 
 def get_args():
@@ -67,6 +495,14 @@ def get_args():
         default='',
         help='Pattern which generated address should contain',
     )
+    parser.add_argument(
+        '-f',
+        '--patterns_file',
+        type=str,
+        required=False,
+        help='File with patterns (one per line) searched at once. Every found address is '
+        'reported and the search continues until interrupted',
+    )
     parser.add_argument(
         '-s', '--symbol', type=check_coin_symbol, required=True, help='Symbol of the coin i.e. BTC'
     )
@@ -94,6 +530,13 @@ def get_args():
     parser.add_argument(
         '-w', '--segwit', action='store_true', help='Generate segwit (P2SH-P2WPKH) address'
     )
+    parser.add_argument(
+        '-b',
+        '--bech32',
+        action='store_true',
+        help='Generate native segwit (P2WPKH) bech32 address, pattern must contain human '
+        'readable part and witness version i.e. bc1q',
+    )
     parser.add_argument(
         '-d',
         '--output_dir',
@@ -101,23 +544,110 @@ def get_args():
         required=False,
         help='Directory where QR codes with address and private key will be stored',
     )
+    parser.add_argument(
+        '--start',
+        type=lambda value: int(value, 0),
+        required=False,
+        help='First private key (decimal or 0x prefixed hex) of the keyspace. Workers of all '
+        'nodes check disjoint interleaved keys start + k * nodes * cores + worker id. '
+        'Random start is used when not provided',
+    )
+    parser.add_argument(
+        '--node',
+        type=int,
+        required=False,
+        default=0,
+        help='Index of this machine when the keyspace is split across nodes. Default 0.',
+    )
+    parser.add_argument(
+        '--nodes',
+        type=int,
+        required=False,
+        default=1,
+        help='Number of machines splitting the keyspace, each of them must use the same '
+        'number of cores. Default 1.',
+    )
+    parser.add_argument(
+        '--checkpoint_dir',
+        type=str,
+        required=False,
+        help='Directory where workers periodically save their positions and resume from them '
+        'after restart. Checkpoints allow recovering private keys of found addresses, '
+        'keep them secret',
+    )
+    parser.add_argument(
+        '--checkpoint_interval',
+        type=int,
+        required=False,
+        default=CHECKPOINT_INTERVAL,
+        help=f'Number of keys checked by a worker between checkpoints. '
+        f'Default {CHECKPOINT_INTERVAL}.',
+    )
+    parser.add_argument(
+        '--stats_interval',
+        type=float,
+        required=False,
+        default=STATS_INTERVAL,
+        help=f'Seconds between reports of aggregated speed, expected time and workers skew, '
+        f'0 disables reports. Default {STATS_INTERVAL}.',
+    )
+    parser.add_argument(
+        '--max_time',
+        type=float,
+        required=False,
+        help='Maximal expected time of the search in seconds, the search is not started '
+        'when patterns are too difficult',
+    )
 
     return parser.parse_args()
 
 
+def validate_keyspace(args):
+    if not 0 <= args.node < args.nodes:
+        raise ValueError(f'Node index must be between 0 and {args.nodes - 1}')
+    if args.start is not None and not 0 < args.start < N:
+        raise ValueError('Start private key must be between 1 and order of the curve')
+    if args.cores < 1:
+        raise ValueError('Number of cores must be at least 1')
+    if args.checkpoint_interval < 1:
+        raise ValueError('Checkpoint interval must be at least 1')
+
+
+def get_worker_keyspace(args, worker_num):
+    """
+    Calculate part of the keyspace checked by the worker. Workers of all nodes are numbered
+    globally and check interleaved keys, so their ranges are disjoint. Existing checkpoint
+    is checked against the keyspace, so changed partitioning is reported before workers start.
+    :return: Keyword arguments of generate_address describing the keyspace and checkpoint
+    """
+    worker_id = args.node * args.cores + worker_num
+    checkpoint_file = None
+    if args.checkpoint_dir:
+        os.makedirs(args.checkpoint_dir, exist_ok=True)
+        checkpoint_file = os.path.join(args.checkpoint_dir, f'worker_{worker_id}.json')
+    start = None if args.start is None else args.start + worker_id
+    stride = args.nodes * args.cores
+    read_checkpoint(checkpoint_file, start, stride)
+    return {
+        'start': start,
+        'stride': stride,
+        'checkpoint_file': checkpoint_file,
+        'checkpoint_interval': args.checkpoint_interval,
+    }
+
+
 def start_workers(args):
     coin_symbol = args.symbol
-    pattern = args.pattern
     workers = args.cores
     compressed = not args.uncompressed
     segwit = args.segwit
     output_dir = args.output_dir
     input_script = args.input_script
-    if segwit and not compressed:
-        raise ValueError('Segwit addresses must used compressed public key representation')
-    jobs = []
     try:
-        validate_pattern(pattern, coin_symbol, segwit)
+        validate_keyspace(args)
+        validate_stats_interval(args.stats_interval)
+        patterns = read_patterns(args)
+        validate_patterns(patterns, coin_symbol, compressed, segwit, args.bech32)
         if input_script:
             validate_hex_script(input_script)
             address = convert_script_to_p2sh_address(
@@ -127,22 +657,38 @@ def start_workers(args):
                 save_qrcode(address, output_dir)
             print(address)
             return
-    except ValueError as exc:
+        keyspaces = [get_worker_keyspace(args, i) for i in range(workers)]
+        pattern_index, _ = create_pattern_index(coins[coin_symbol], patterns, segwit, args.bech32)
+        key_rate = measure_key_rate(pattern_index, compressed, segwit)
+        estimate_search(pattern_index, key_rate, workers, args.max_time)
+    except (OSError, ValueError) as exc:
         logger.error(exc)
         return
+    if len(patterns) == 1:
+        patterns_description = f'pattern {patterns[0]}'
+    else:
+        patterns_description = f'{len(patterns)} patterns'
     print(
-        f'Looking for pattern {pattern} for {coins[coin_symbol]["name"]} using {workers} workers'
-    )
-    stop = multiprocessing.Event()
-    found = multiprocessing.Event()
-    for i in range(workers):
-        p = multiprocessing.Process(
-            target=generate_address,
-            args=(i, coins[coin_symbol], pattern, compressed, segwit, output_dir, found, stop),
-        )
-        jobs.append(p)
-        p.start()
-    found.wait()
+        f'Looking for {patterns_description} for {coins[coin_symbol]["name"]} '
+        f'using {workers} workers'
+    )
+    stop_on_first = not args.patterns_file  # patterns from file are searched until interrupted
+    with AddressGenerationPool(
+        coins[coin_symbol],
+        patterns,
+        compressed,
+        segwit,
+        output_dir,
+        keyspaces,
+        args.bech32,
+        stop_on_first,
+        verbose=True,
+    ) as pool:
+        try:
+            supervise_workers(pool, args.stats_interval, pattern_index.match_probability())
+        except KeyboardInterrupt:
+            print('Stopping workers')
+    return pool.found_addresses
 
 
 def main():
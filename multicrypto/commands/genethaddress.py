@@ -0,0 +1,147 @@
+import argparse
+import logging
+import sys
+from itertools import islice
+
+from multicrypto.commands.genaddress import (
+    STATS_INTERVAL,
+    WorkerPool,
+    supervise_workers,
+    validate_stats_interval,
+)
+from multicrypto.ellipticcurve import secp256k1, WALK_BATCH_SIZE
+from multicrypto.ethaddress import (
+    calculate_address_digests,
+    convert_private_key_to_wif_format,
+    get_pattern_mask,
+    to_checksum_address,
+    validate_pattern,
+)
+
+logger = logging.getLogger(__name__)
+N = secp256k1.n  # order of the curve
+G = secp256k1.G  # generator point
+
+
+def generate_eth_address(
+    worker_num,
+    prefix,
+    suffix,
+    found,
+    stop,
+    with_check_sum=False,
+    counters=None,
+    results=None,
+    verbose=False,
+):
+    """
+    Search for Ethereum address with given hexadecimal prefix and suffix (case insensitive).
+    Public keys of consecutive private keys are calculated in batches by adding generator
+    point and keccak hashes of the whole batch are compared with pattern nibble mask.
+    Found address and private key are printed only with verbose flag.
+    :return: Pair (address, private key) or None when stopped
+    """
+    mask, value = get_pattern_mask(prefix.lower(), suffix.lower())
+    seed = secp256k1.gen_private_key()
+    points = secp256k1.walk_points(seed * G, G)
+    counter = 0
+    while not stop.is_set():
+        if counters is not None:
+            counters[worker_num] = counter
+        for i, digest in enumerate(
+            calculate_address_digests(islice(points, WALK_BATCH_SIZE)), start=counter
+        ):
+            if int.from_bytes(digest, byteorder='big') & mask == value:
+                address = '0x' + digest.hex()
+                if with_check_sum:
+                    address = to_checksum_address(address)
+                private_key = convert_private_key_to_wif_format((seed + i) % N)
+                if verbose:
+                    print(f'Address: {address}\nPrivate key: {private_key}')
+                    sys.stdout.flush()
+                if results is not None:
+                    results.put((address, private_key))
+                found.set()
+                stop.set()
+                return address, private_key
+        counter += WALK_BATCH_SIZE
+    return None
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description='Ethereum vanity address generation script')
+    parser.add_argument(
+        '-p',
+        '--prefix',
+        type=str,
+        required=False,
+        default='',
+        help='Hexadecimal digits which address should start with (after 0x)',
+    )
+    parser.add_argument(
+        '-x',
+        '--suffix',
+        type=str,
+        required=False,
+        default='',
+        help='Hexadecimal digits which address should end with',
+    )
+    parser.add_argument(
+        '-c',
+        '--cores',
+        type=int,
+        required=False,
+        default=1,
+        help='How many cores we would like to use. Default 1 core.',
+    )
+    parser.add_argument(
+        '-k',
+        '--checksum',
+        action='store_true',
+        help='Print address with mixed case checksum (patterns are matched case insensitive)',
+    )
+    parser.add_argument(
+        '--stats_interval',
+        type=float,
+        required=False,
+        default=STATS_INTERVAL,
+        help=f'Seconds between reports of aggregated speed, expected time and workers skew, '
+        f'0 disables reports. Default {STATS_INTERVAL}.',
+    )
+
+    return parser.parse_args()
+
+
+def start_workers(args):
+    try:
+        validate_pattern(args.prefix, args.suffix)
+        validate_stats_interval(args.stats_interval)
+    except ValueError as exc:
+        logger.error(exc)
+        return
+    print(f'Looking for address 0x{args.prefix}...{args.suffix} using {args.cores} workers')
+    workers_kwargs = [
+        {
+            'prefix': args.prefix,
+            'suffix': args.suffix,
+            'with_check_sum': args.checksum,
+            'verbose': True,
+        }
+        for _ in range(args.cores)
+    ]
+    probability = 16 ** -(len(args.prefix) + len(args.suffix))
+    with WorkerPool(generate_eth_address, workers_kwargs) as pool:
+        try:
+            supervise_workers(pool, args.stats_interval, probability)
+        except KeyboardInterrupt:
+            print('Stopping workers')
+    return pool.found_addresses
+
+
+def main():
+    args = get_args()
+    start_workers(args)
+
+
+if __name__ == '__main__':
+    main()
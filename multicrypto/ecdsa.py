@@ -30,9 +30,7 @@ def verify(message, signature, public_key, curve=secp256k1, hash_function=sha256
     int_hashed_message = int.from_bytes(hashed_message, byteorder='big')
     r, s = signature
     w = modular_inverse(s, curve.n)
-    U1 = curve.G * ((int_hashed_message * w) % curve.n)
-    U2 = public_key * ((r * w) % curve.n)
-    V = U1 + U2
+    V = curve.multiply_two(curve.G, int_hashed_message * w, public_key, r * w)
     return r == V.x
 
 
@@ -64,8 +62,9 @@ def verify_message(
     R = Point(curve, x, y)
     h = hash_function(message).digest()
     e = int.from_bytes(h, byteorder='big')
-    Q = modular_inverse(r, curve.n) * (s * R - e * curve.G)
-    public_key = Q
+    r_inverse = modular_inverse(r, curve.n)
+    # Q = r^-1 * (s * R - e * G)
+    public_key = curve.multiply_two(R, s * r_inverse, curve.G, -e * r_inverse)
     calculated_address = convert_public_key_to_address(
         public_key, coin['address_prefix_bytes'], compressed
     )
@@ -1,10 +1,66 @@
 from os import urandom
 
-from multicrypto.numbertheory import modular_inverse
+from multicrypto.numbertheory import batch_modular_inverse, modular_inverse
+
+# Point at infinity in Jacobian coordinates (any triple with Z == 0)
+JACOBIAN_IDENTITY = (1, 1, 0)
+# Number of scalar bits handled by one row of the precomputed base point table
+GENERATOR_WINDOW_BITS = 8
+# Window width of the wNAF representation used in joint scalar multiplication
+WNAF_WINDOW_BITS = 4
+# Number of consecutive points sharing one modular inversion when walking the curve
+WALK_BATCH_SIZE = 1024
+
+
+def wnaf(multiplier, window_bits=WNAF_WINDOW_BITS):
+    """
+    Width-w non-adjacent form of non negative integer. Digits are odd numbers from
+    range (-2^(w-1), 2^(w-1)) or zeros, least significant digit first. For window
+    of 1 bit plain binary representation is returned.
+    """
+    if window_bits == 1:
+        return [int(bit) for bit in reversed(bin(multiplier)[2:])] if multiplier else []
+    digits = []
+    window_size = 1 << window_bits
+    while multiplier:
+        digit = 0
+        if multiplier & 1:
+            digit = multiplier & (window_size - 1)
+            if digit >= window_size >> 1:
+                digit -= window_size
+            multiplier -= digit
+        digits.append(digit)
+        multiplier >>= 1
+    return digits
+
+
+class Endomorphism:
+    def __init__(self, beta, lam, basis):
+        """
+        Efficiently computable endomorphism (x, y) -> (beta * x, y) which equals multiplication
+        of the point by lambda. It allows to split the multiplier into two halves (GLV method).
+        :param beta: Cube root of unity modulo p
+        :param lam: Cube root of unity modulo n (lambda)
+        :param basis: Short lattice basis ((a1, b1), (a2, b2)) fulfilling
+                      `a + b * lambda = 0 (mod n)` for both vectors
+        """
+        self.beta = beta
+        self.lam = lam
+        self.basis = basis
+
+    def split(self, multiplier, n):
+        """
+        Return pair (k1, k2) of integers with about half bit length of `n` fulfilling
+        equation `k1 + k2 * lambda = multiplier (mod n)`.
+        """
+        (a1, b1), (a2, b2) = self.basis
+        c1 = (2 * b2 * multiplier + n) // (2 * n)  # rounded division
+        c2 = (-2 * b1 * multiplier + n) // (2 * n)
+        return multiplier - c1 * a1 - c2 * a2, -c1 * b1 - c2 * b2
 
 
 class Curve:
-    def __init__(self, name, p, a, b, n, gx, gy):
+    def __init__(self, name, p, a, b, n, gx, gy, endomorphism=None):
         """
         An elliptic curve representing equation y^2 = x^3 + a*x + b (mod p)
         :param name: Name of the curve
@@ -14,6 +70,7 @@ class Curve:
         :param n: The order of the base point of the curve
         :param gx: The x coordinate of the base point of the curve.
         :param gy: The y coordinate of the base point of the curve.
+        :param endomorphism: Optional endomorphism used to speed up multiplication
         """
         self.name = name
         self.p = p
@@ -22,7 +79,10 @@ class Curve:
         self.n = n
         self.gx = gx
         self.gy = gy
+        self.endomorphism = endomorphism
+        self.identity_point = Point.from_trusted(self, 0, 0)  # shared, points are immutable
         self.G = Point(self, gx, gy)
+        self.generator_table = None  # built lazily by `get_generator_table`
 
     def __str__(self):
         return f'curve {self.name}'
@@ -31,10 +91,6 @@ class Curve:
     def bytes_size(self):
         return (self.n.bit_length() + 7) // 8
 
-    @property
-    def identity_point(self):
-        return Point(self, 0, 0)
-
     def is_point_on_curve(self, point):
         if point.x == point.y == 0:  # identity point
             return True
@@ -42,6 +98,304 @@ class Curve:
         right = (pow(point.x, 3, self.p) + self.a * point.x + self.b) % self.p
         return left == right
 
+    def to_jacobian(self, point):
+        """
+        Convert affine point to Jacobian coordinates (X, Y, Z), where x = X/Z^2 and y = Y/Z^3.
+        Jacobian coordinates allow adding and doubling points without modular inversion.
+        """
+        if point.x == point.y == 0:  # identity point
+            return JACOBIAN_IDENTITY
+        return point.x, point.y, 1
+
+    def from_jacobian(self, jacobian_point):
+        """
+        Convert point in Jacobian coordinates back to affine point using single inversion.
+        """
+        x, y, z = jacobian_point
+        if z == 0:
+            return self.identity_point
+        p = self.p
+        z_inverse = modular_inverse(z, p)
+        z_inverse_squared = (z_inverse * z_inverse) % p
+        return Point.from_trusted(
+            self, (x * z_inverse_squared) % p, (y * z_inverse_squared * z_inverse) % p
+        )
+
+    def to_affine_coordinates(self, jacobian_points):
+        """
+        Convert many points from Jacobian to affine (x, y) coordinates sharing one modular
+        inversion (Montgomery's trick). Identity points are returned as (0, 0).
+        """
+        p = self.p
+        z_inverses = batch_modular_inverse([z for _, _, z in jacobian_points], p)
+        coordinates = []
+        for (x, y, z), z_inverse in zip(jacobian_points, z_inverses):
+            if not z:
+                coordinates.append((0, 0))
+                continue
+            z_inverse_squared = (z_inverse * z_inverse) % p
+            coordinates.append(
+                ((x * z_inverse_squared) % p, (y * z_inverse_squared * z_inverse) % p)
+            )
+        return coordinates
+
+    def get_generator_table(self):
+        """
+        Fixed-base table for the generator point built once per process. Row `i` contains
+        affine coordinates of points `j * 2^(i * GENERATOR_WINDOW_BITS) * G` for
+        j = 0..2^GENERATOR_WINDOW_BITS-1, so multiplying G needs only additions.
+        """
+        if self.generator_table is None:
+            row_size = 1 << GENERATOR_WINDOW_BITS
+            rows_number = (self.n.bit_length() + GENERATOR_WINDOW_BITS - 1) // GENERATOR_WINDOW_BITS
+            jacobian_points = []
+            base_x, base_y = self.gx, self.gy
+            for _ in range(rows_number):
+                row_point = JACOBIAN_IDENTITY
+                for _ in range(1, row_size):
+                    row_point = self.jacobian_add_affine(row_point, base_x, base_y)
+                    jacobian_points.append(row_point)
+                base_x, base_y = self.to_affine_coordinates(
+                    [self.jacobian_add_affine(row_point, base_x, base_y)]
+                )[0]
+            coordinates = self.to_affine_coordinates(jacobian_points)
+            self.generator_table = [
+                [None] + coordinates[i * (row_size - 1) : (i + 1) * (row_size - 1)]
+                for i in range(rows_number)
+            ]
+        return self.generator_table
+
+    def jacobian_multiply_generator(self, multiplier):
+        """
+        Multiply generator point by integer using fixed-base table, result is in Jacobian
+        coordinates.
+        """
+        table = self.get_generator_table()
+        multiplier %= self.n
+        mask = (1 << GENERATOR_WINDOW_BITS) - 1
+        result = JACOBIAN_IDENTITY
+        row = 0
+        while multiplier:
+            digit = multiplier & mask
+            if digit:
+                x, y = table[row][digit]
+                result = self.jacobian_add_affine(result, x, y)
+            multiplier >>= GENERATOR_WINDOW_BITS
+            row += 1
+        return result
+
+    def jacobian_double(self, jacobian_point):
+        x1, y1, z1 = jacobian_point
+        if z1 == 0 or y1 == 0:
+            return JACOBIAN_IDENTITY
+        p = self.p
+        yy = (y1 * y1) % p
+        s = (4 * x1 * yy) % p
+        m = 3 * x1 * x1
+        if self.a:
+            m += self.a * pow(z1, 4, p)
+        m %= p
+        x3 = (m * m - 2 * s) % p
+        y3 = (m * (s - x3) - 8 * yy * yy) % p
+        z3 = (2 * y1 * z1) % p
+        return x3, y3, z3
+
+    def jacobian_add(self, jacobian_point1, jacobian_point2):
+        x1, y1, z1 = jacobian_point1
+        x2, y2, z2 = jacobian_point2
+        if z1 == 0:
+            return jacobian_point2
+        if z2 == 0:
+            return jacobian_point1
+        p = self.p
+        z1z1 = (z1 * z1) % p
+        z2z2 = (z2 * z2) % p
+        u1 = (x1 * z2z2) % p
+        u2 = (x2 * z1z1) % p
+        s1 = (y1 * z2 * z2z2) % p
+        s2 = (y2 * z1 * z1z1) % p
+        h = (u2 - u1) % p
+        r = (s2 - s1) % p
+        if h == 0:
+            if r == 0:  # adding point to itself
+                return self.jacobian_double(jacobian_point1)
+            return JACOBIAN_IDENTITY
+        hh = (h * h) % p
+        hhh = (h * hh) % p
+        v = (u1 * hh) % p
+        x3 = (r * r - hhh - 2 * v) % p
+        y3 = (r * (v - x3) - s1 * hhh) % p
+        z3 = (z1 * z2 * h) % p
+        return x3, y3, z3
+
+    def jacobian_add_affine(self, jacobian_point, x2, y2):
+        """
+        Add affine point (x2, y2), which must not be the identity point, to the point
+        given in Jacobian coordinates (mixed addition, cheaper than `jacobian_add`).
+        """
+        x1, y1, z1 = jacobian_point
+        if z1 == 0:
+            return x2, y2, 1
+        p = self.p
+        z1z1 = (z1 * z1) % p
+        u2 = (x2 * z1z1) % p
+        s2 = (y2 * z1 * z1z1) % p
+        h = (u2 - x1) % p
+        r = (s2 - y1) % p
+        if h == 0:
+            if r == 0:  # adding point to itself
+                return self.jacobian_double(jacobian_point)
+            return JACOBIAN_IDENTITY
+        hh = (h * h) % p
+        hhh = (h * hh) % p
+        v = (x1 * hh) % p
+        x3 = (r * r - hhh - 2 * v) % p
+        y3 = (r * (v - x3) - y1 * hhh) % p
+        z3 = (z1 * h) % p
+        return x3, y3, z3
+
+    def jacobian_multiply(self, point, multiplier):
+        """
+        Multiply affine point by non negative integer, result is in Jacobian coordinates.
+        """
+        if multiplier == 0 or point.x == point.y == 0:
+            return JACOBIAN_IDENTITY
+        x, y = point.x, point.y
+        result = JACOBIAN_IDENTITY
+        for bit in bin(multiplier)[2:]:  # left to right double and add loop
+            result = self.jacobian_double(result)
+            if bit == '1':
+                result = self.jacobian_add_affine(result, x, y)
+        return result
+
+    def get_odd_multiples_tables(self, coordinates, window_bits):
+        """
+        For every affine point (x, y) return affine coordinates of its odd multiples
+        point, 3 * point, ..., (2^(w-1) - 1) * point used by wNAF multiplication.
+        """
+        if window_bits == 1:
+            return [[(x, y)] for x, y in coordinates]
+        row_size = 1 << (window_bits - 2)
+        jacobian_points = []
+        for x, y in coordinates:
+            multiple = (x, y, 1)
+            double_point = self.jacobian_double(multiple)
+            jacobian_points.append(multiple)
+            for _ in range(row_size - 1):
+                multiple = self.jacobian_add(double_point, multiple)
+                jacobian_points.append(multiple)
+        tables = self.to_affine_coordinates(jacobian_points)
+        return [tables[i * row_size : (i + 1) * row_size] for i in range(len(coordinates))]
+
+    def split_terms(self, point, multiplier):
+        """
+        Return terms (x, y, multiplier) with positive multipliers which sum up to
+        `multiplier * point`. When the curve has an endomorphism the multiplier is split
+        into two halves of about half bit length (GLV method).
+        """
+        multiplier %= self.n
+        if multiplier == 0 or point.x == point.y == 0:
+            return []
+        if self.endomorphism is None:
+            return [(point.x, point.y, multiplier)]
+        p = self.p
+        multiplier1, multiplier2 = self.endomorphism.split(multiplier, self.n)
+        terms = []
+        for x, y, term_multiplier in (
+            (point.x, point.y, multiplier1),
+            ((self.endomorphism.beta * point.x) % p, point.y, multiplier2),
+        ):
+            if term_multiplier < 0:
+                y, term_multiplier = (-y) % p, -term_multiplier
+            if term_multiplier:
+                terms.append((x, y, term_multiplier))
+        return terms
+
+    def jacobian_multiply_sum(self, terms, window_bits=WNAF_WINDOW_BITS):
+        """
+        Calculate sum of `multiplier * (x, y)` for terms (x, y, multiplier) using Strauss
+        (Shamir's trick) method, result is in Jacobian coordinates. All multiplications share
+        the same doublings and the multipliers are recoded to wNAF so only every
+        `window_bits` bit on average needs an addition.
+        """
+        if not terms:
+            return JACOBIAN_IDENTITY
+        recoded_multipliers = [wnaf(multiplier, window_bits) for _, _, multiplier in terms]
+        tables = self.get_odd_multiples_tables([(x, y) for x, y, _ in terms], window_bits)
+        p = self.p
+        result = JACOBIAN_IDENTITY
+        for i in range(max(len(digits) for digits in recoded_multipliers) - 1, -1, -1):
+            result = self.jacobian_double(result)
+            for digits, table in zip(recoded_multipliers, tables):
+                if i >= len(digits) or not digits[i]:
+                    continue
+                digit = digits[i]
+                if digit > 0:
+                    x, y = table[digit >> 1]
+                    result = self.jacobian_add_affine(result, x, y)
+                else:
+                    x, y = table[-digit >> 1]
+                    result = self.jacobian_add_affine(result, x, p - y)
+        return result
+
+    def jacobian_multiply_two(
+        self, point1, multiplier1, point2, multiplier2, window_bits=WNAF_WINDOW_BITS
+    ):
+        """
+        Calculate `multiplier1 * point1 + multiplier2 * point2` with shared doublings,
+        result is in Jacobian coordinates. Generator point contribution is taken from
+        the fixed-base table instead.
+        """
+        result = JACOBIAN_IDENTITY
+        terms = []
+        for point, multiplier in ((point1, multiplier1), (point2, multiplier2)):
+            if point.x == self.gx and point.y == self.gy:
+                result = self.jacobian_add(result, self.jacobian_multiply_generator(multiplier))
+            else:
+                terms.extend(self.split_terms(point, multiplier))
+        return self.jacobian_add(result, self.jacobian_multiply_sum(terms, window_bits))
+
+    def multiply_two(self, point1, multiplier1, point2, multiplier2):
+        """Calculate `multiplier1 * point1 + multiplier2 * point2` using shared doublings."""
+        return self.from_jacobian(
+            self.jacobian_multiply_two(point1, multiplier1, point2, multiplier2)
+        )
+
+    def walk_points(self, point, step, batch_size=WALK_BATCH_SIZE):
+        """
+        Infinite generator of affine coordinates (x, y) of points
+        point, point + step, point + 2 * step, ...
+        Points are calculated in batches, all additions in the batch share one modular
+        inversion (Montgomery's trick) and no Point objects are created.
+        """
+        p = self.p
+        step_multiples = self.to_affine_coordinates(
+            [self.jacobian_multiply(step, i) for i in range(1, batch_size + 1)]
+        )
+        x, y = point.x, point.y
+        while True:
+            # denominators of slopes for additions point + i * step
+            denominators = [(step_x - x) % p for step_x, _ in step_multiples]
+            if 0 in denominators:  # point is equal to +-(i * step) for some i, very unlikely
+                for i in range(batch_size):
+                    yield self.to_affine_coordinates(
+                        [self.jacobian_add(self.jacobian_multiply(step, i), (x, y, 1))]
+                    )[0]
+                x, y = self.to_affine_coordinates(
+                    [self.jacobian_add(self.jacobian_multiply(step, batch_size), (x, y, 1))]
+                )[0]
+                continue
+            new_points = []
+            for (step_x, step_y), denominator_inverse in zip(
+                step_multiples, batch_modular_inverse(denominators, p)
+            ):
+                slope = ((step_y - y) * denominator_inverse) % p
+                new_x = (slope * slope - x - step_x) % p
+                new_points.append((new_x, (slope * (x - new_x) - y) % p))
+            yield x, y
+            yield from new_points[:-1]
+            x, y = new_points[-1]
+
     def gen_private_key(self):
         order_bits = 0
         order = self.n
@@ -60,9 +414,12 @@ class Curve:
 
 
 class Point:
+    __slots__ = ('curve', 'x', 'y')
+
     def __init__(self, curve, x, y):
         """
-        Point on elliptic curve with (x, y) coordinates
+        Point on elliptic curve with (x, y) coordinates. Points are treated as immutable,
+        in-place operators like `+=` bind new point instead of modifying existing one.
         :param curve: Elliptic curve
         :param x: x coordinate
         :param y: y coordinate
@@ -73,19 +430,28 @@ class Point:
         if not curve.is_point_on_curve(self):
             raise Exception(f'Point {self} is not on the curve {curve}')
 
+    @classmethod
+    def from_trusted(cls, curve, x, y):
+        """
+        Create point skipping coordinates reduction and validation. Only for results
+        of arithmetic on curve points, externally supplied points must use the constructor.
+        :param curve: Elliptic curve
+        :param x: x coordinate already reduced modulo p
+        :param y: y coordinate already reduced modulo p
+        """
+        point = object.__new__(cls)
+        point.curve = curve
+        point.x = x
+        point.y = y
+        return point
+
     def __eq__(self, other):
         return self.x == other.x and self.y == other.y
 
-    def __iadd__(self, other):
-        result = self.__add__(other)
-        self.x = result.x
-        self.y = result.y
-        return self
-
     def __add__(self, other):
-        if self == self.curve.identity_point:
+        if not (self.x or self.y):  # identity point
             return other
-        if other == self.curve.identity_point:
+        if not (other.x or other.y):
             return self
 
         if self.x == other.x:
@@ -99,37 +465,24 @@ class Point:
         return self.line_intersect(other, slope)
 
     def __sub__(self, other):
-        neg_other = Point(self.curve, other.x, -other.y % self.curve.p)
+        neg_other = Point.from_trusted(self.curve, other.x, -other.y % self.curve.p)
         return self.__add__(neg_other)
 
-    def __isub__(self, other):
-        result = self.__sub__(other)
-        self.x = result.x
-        self.y = result.y
-        return self
-
     def __mul__(self, multiplier):
-        result_point = self.curve.identity_point
-        double_point = self
+        curve = self.curve
         if multiplier < 0:
-            multiplier %= self.curve.n
-        while multiplier != 0:  # binary multiply loop
-            if multiplier & 1:  # bit is set
-                result_point = result_point + double_point
-            multiplier >>= 1
-            if multiplier != 0:
-                double_point = double_point.double()
-        return result_point
+            multiplier %= curve.n
+        if self.x == curve.gx and self.y == curve.gy:
+            return curve.from_jacobian(curve.jacobian_multiply_generator(multiplier))
+        if curve.endomorphism is not None:
+            return curve.from_jacobian(
+                curve.jacobian_multiply_sum(curve.split_terms(self, multiplier))
+            )
+        return curve.from_jacobian(curve.jacobian_multiply(self, multiplier))
 
     def __rmul__(self, multiplier):
         return self.__mul__(multiplier)
 
-    def __imul__(self, multiplier):
-        result = self.__mul__(multiplier)
-        self.x = result.x
-        self.y = result.y
-        return self
-
     def line_intersect(self, other_point, m):
         """
         Return the point where this line intersects our curve.
@@ -137,9 +490,9 @@ class Point:
         """
         p = self.curve.p
         v = (self.y + p - (m * self.x) % p) % p
-        x = m * m + p - self.x + p - other_point.x
-        y = p - (m * x) % p + p - v
-        return Point(self.curve, x, y)
+        x = (m * m + p - self.x + p - other_point.x) % p
+        y = (p - (m * x) % p + p - v) % p
+        return Point.from_trusted(self.curve, x, y)
 
     # Return the slope of the tangent of this curve
     def tangent(self):
@@ -164,4 +517,12 @@ secp256k1 = Curve(
     n=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141,
     gx=0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
     gy=0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+    endomorphism=Endomorphism(
+        beta=0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE,
+        lam=0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72,
+        basis=(
+            (0x3086D221A7D46BCDE86C90E49284EB15, -0xE4437ED6010E88286F547FA90ABFE4C3),
+            (0x114CA50F7A8E2F3F657C1108D9D44CFD8, 0x3086D221A7D46BCDE86C90E49284EB15),
+        ),
+    ),
 )
@@ -1,3 +1,5 @@
+from string import hexdigits
+
 from Crypto.Hash import keccak
 from multicrypto.ellipticcurve import secp256k1
 
@@ -6,9 +8,22 @@ def keccak_256(data):
     return keccak.new(data=data, digest_bits=256, update_after_digest=True)
 
 
+def calculate_address_digests(coordinates):
+    """
+    Calculate addresses (as bytes) for batch of public keys. Address consists of the last
+    20 bytes of keccak-256 hash of raw public key coordinates x and y.
+    :param coordinates: Iterable of affine coordinates (x, y) of public keys
+    :return: List of 20 bytes addresses
+    """
+    digests = []
+    for x, y in coordinates:
+        data = x.to_bytes(32, byteorder='big') + y.to_bytes(32, byteorder='big')
+        digests.append(keccak.new(data=data, digest_bits=256).digest()[12:])
+    return digests
+
+
 def convert_public_key_to_address(public_key, with_check_sum=False):
-    encoded_public_key = f'{public_key.x}{public_key.y}'.encode()
-    address = '0x' + keccak_256(encoded_public_key).hexdigest()[24:]
+    address = '0x' + calculate_address_digests([(public_key.x, public_key.y)])[0].hex()
     if with_check_sum:
         address = to_checksum_address(address)
     return address
@@ -34,3 +49,24 @@ def convert_private_key_to_wif_format(private_key):
     hex_value = hex(private_key)[2:]
     padding = '0' * (64 - len(hex_value))
     return padding + hex_value
+
+
+def validate_pattern(prefix, suffix=''):
+    if len(prefix) + len(suffix) > 40:
+        raise ValueError('Prefix and suffix together can not be longer than 40 characters')
+    for pattern in (prefix, suffix):
+        if not all(character in hexdigits for character in pattern):
+            raise ValueError(f'Pattern {pattern} must contain only hexadecimal digits')
+    return True
+
+
+def get_pattern_mask(prefix='', suffix=''):
+    """
+    Compile hexadecimal prefix and suffix of address (case insensitive) to nibble mask,
+    address (as integer) matches patterns when address & mask == value.
+    :return: Pair (mask, value)
+    """
+    prefix_shift = 4 * (40 - len(prefix))
+    mask = ((1 << 4 * len(prefix)) - 1) << prefix_shift | (1 << 4 * len(suffix)) - 1
+    value = int(prefix or '0', 16) << prefix_shift | int(suffix or '0', 16)
+    return mask, value
@@ -1,20 +1,42 @@
 def modular_inverse(a, n):
     """
-    Extended Euclidean Algorithm. It's the 'division' in elliptic curves
+    Modular inverse, it's the 'division' in elliptic curves
     :param a: Divisor
     :param n: Mod for division
-    :return: Value which fulfill equation `(value * a) % n == 1`
+    :return: Value which fulfill equation `(value * a) % n == 1` or 0 when `a` is divisible by n
     """
     a %= n
     if a == 0:
         return 0
-    lm, hm = 1, 0
-    low, high = a % n, n
-    while low > 1:
-        r = high // low
-        nm, new = hm - lm * r, high - low * r
-        lm, low, hm, high = nm, new, lm, low
-    return lm % n
+    return pow(a, -1, n)
+
+
+def batch_modular_inverse(values, n):
+    """
+    Montgomery's simultaneous inversion. Inverts all values using one modular inversion
+    and three multiplications per value.
+    :param values: List of divisors
+    :param n: Mod for division
+    :return: List of modular inverses of values (0 for values divisible by n)
+    """
+    if len(values) == 1:
+        return [modular_inverse(values[0], n)]
+    products = []
+    product = 1
+    for value in values:
+        value %= n
+        if value:
+            product = (product * value) % n
+        products.append(product)
+    inverse = modular_inverse(product, n)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        value = values[i] % n
+        if not value:
+            continue
+        inverses[i] = (inverse * products[i - 1]) % n if i else inverse
+        inverse = (inverse * value) % n
+    return inverses
 
 
 def legendre_symbol(a, p):
@@ -36,42 +36,54 @@
 
 
 import struct
-import sys
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 def ripemd160(b: bytes) -> bytes:
+    if len(b) == 32:
+        return ripemd160_32(b)
     ctx = RMDContext()
     RMD160Update(ctx, b, len(b))
     digest = RMD160Final(ctx)
     return digest
 
 
+def ripemd160_32(b: bytes) -> bytes:
+    """Fast path for 32 bytes long input (SHA-256 digest hashed by hash160), which
+    together with padding fits into one block."""
+    state = [0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0]
+    RMD160Transform(state, b + PADDING_32)
+    return struct.pack("<5L", *state)
+
+
 class RMDContext:
     def __init__(self):
         self.state = [0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0]  # uint32
         self.count = 0  # uint64
-        self.buffer = [0] * 64  # uchar
+        self.buffer = b''  # not yet processed input, shorter than 64 bytes
 
 
 def RMD160Update(ctx, inp, inplen):
-    have = int((ctx.count // 8) % 64)
     inplen = int(inplen)
-    need = 64 - have
     ctx.count += 8 * inplen
+    data = memoryview(bytes(inp[:inplen]))
     off = 0
-    if inplen >= need:
-        if have:
-            for i in range(need):
-                ctx.buffer[have + i] = inp[i]
-            RMD160Transform(ctx.state, ctx.buffer)
-            off = need
-            have = 0
-        while off + 64 <= inplen:
-            RMD160Transform(ctx.state, inp[off:])  # <---
-            off += 64
-    if off < inplen:
-        for i in range(inplen - off):
-            ctx.buffer[have + i] = inp[off + i]
+    if ctx.buffer:
+        need = 64 - len(ctx.buffer)
+        if inplen < need:
+            ctx.buffer += data.tobytes()
+            return
+        RMD160Transform(ctx.state, ctx.buffer + data[:need].tobytes())
+        ctx.buffer = b''
+        off = need
+    while off + 64 <= inplen:
+        RMD160Transform(ctx.state, data[off : off + 64])
+        off += 64
+    ctx.buffer = data[off:].tobytes()
 
 
 def RMD160Final(ctx):
@@ -95,238 +107,598 @@ KK2 = 0x6D703EF3
 KK3 = 0x7A6D76E9
 KK4 = 0x00000000
 
-PADDING = [0x80] + [0] * 63
-
-
-def ROL(n, x):
-    return ((x << n) & 0xFFFFFFFF) | (x >> (32 - n))
-
-
-def F0(x, y, z):
-    return x ^ y ^ z
-
-
-def F1(x, y, z):
-    return (x & y) | (((~x) % 0x100000000) & z)
-
-
-def F2(x, y, z):
-    return (x | ((~y) % 0x100000000)) ^ z
-
-
-def F3(x, y, z):
-    return (x & z) | (((~z) % 0x100000000) & y)
-
-
-def F4(x, y, z):
-    return x ^ (y | ((~z) % 0x100000000))
-
-
-def R(a, b, c, d, e, Fj, Kj, sj, rj, X):
-    a = ROL(sj, (a + Fj(b, c, d) + X[rj] + Kj) % 0x100000000) + e
-    c = ROL(10, c)
-    return a % 0x100000000, c
+PADDING = b'\x80' + b'\x00' * 63
+# Padding of 32 bytes message: 0x80 marker, zeros and message length in bits (256)
+PADDING_32 = b'\x80' + b'\x00' * 23 + struct.pack("<Q", 256)
+
+
+# Message word selection and rotation amounts of the left and right (parallel) lines,
+# used by the lane parallel implementation
+# fmt: off
+R_LEFT = [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+    7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+    3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
+    1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+    4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13,
+]
+R_RIGHT = [
+    5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
+    6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+    15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
+    8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+    12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11,
+]
+S_LEFT = [
+    11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
+    7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+    11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
+    11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+    9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6,
+]
+S_RIGHT = [
+    8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
+    9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+    9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
+    15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+    8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11,
+]
+# fmt: on
+K_LEFT = [K0, K1, K2, K3, K4]
+K_RIGHT = [KK0, KK1, KK2, KK3, KK4]
+
+LANE_FUNCTIONS = [
+    lambda x, y, z: x ^ y ^ z,
+    lambda x, y, z: (x & y) | (~x & z),
+    lambda x, y, z: (x | ~y) ^ z,
+    lambda x, y, z: (x & z) | (y & ~z),
+    lambda x, y, z: x ^ (y | ~z),
+]
+
+
+def ripemd160_32_many(data: bytes) -> bytes:
+    """
+    RIPEMD-160 of many 32 bytes long messages computed lane parallel on numpy uint32 arrays,
+    each array element (lane) holds one message.
+    :param data: Concatenated 32 bytes long messages
+    :return: Concatenated 20 bytes long digests
+    """
+    if numpy is None:
+        raise ImportError('numpy is required for lane parallel RIPEMD-160')
+    words = numpy.frombuffer(data + PADDING_32 * (len(data) // 32), dtype='<u4')
+    messages_number = len(data) // 32
+    block = numpy.empty((16, messages_number), dtype=numpy.uint32)
+    block[:8] = words[: 8 * messages_number].reshape(messages_number, 8).T
+    block[8:] = words[8 * messages_number :].reshape(messages_number, 8).T
+    initial_state = [
+        numpy.full(messages_number, value, dtype=numpy.uint32)
+        for value in (0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0)
+    ]
+    lines = []
+    for selection, rotations, constants, functions in (
+        (R_LEFT, S_LEFT, K_LEFT, LANE_FUNCTIONS),
+        (R_RIGHT, S_RIGHT, K_RIGHT, LANE_FUNCTIONS[::-1]),
+    ):
+        a, b, c, d, e = initial_state
+        for step in range(80):
+            t = a + functions[step // 16](b, c, d) + block[selection[step]]
+            t += numpy.uint32(constants[step // 16])
+            s = rotations[step]
+            t = ((t << numpy.uint32(s)) | (t >> numpy.uint32(32 - s))) + e
+            a, e, d, c, b = e, d, (c << numpy.uint32(10)) | (c >> numpy.uint32(22)), b, t
+        lines.append((a, b, c, d, e))
+    (a1, b1, c1, d1, e1), (a2, b2, c2, d2, e2) = lines
+    h0, h1, h2, h3, h4 = initial_state
+    digests = numpy.stack(
+        [h1 + c1 + d2, h2 + d1 + e2, h3 + e1 + a2, h4 + a1 + b2, h0 + b1 + c2], axis=1
+    )
+    return digests.astype('<u4').tobytes()
 
 
 def RMD160Transform(state, block):  # uint32 state[5], uchar block[64]
-
-    x = [0] * 16
-    assert sys.byteorder == 'little', "Only little endian is supported atm for RIPEMD160"
-    x = struct.unpack('<16L', bytes(block[0:64]))
-
-    a = state[0]
-    b = state[1]
-    c = state[2]
-    d = state[3]
-    e = state[4]
+    (x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15) = struct.unpack(
+        '<16L', block
+    )
+    a1 = a2 = state[0]
+    b1 = b2 = state[1]
+    c1 = c2 = state[2]
+    d1 = d2 = state[3]
+    e1 = e2 = state[4]
 
     # /* Round 1 */
-    a, c = R(a, b, c, d, e, F0, K0, 11, 0, x)
-    e, b = R(e, a, b, c, d, F0, K0, 14, 1, x)
-    d, a = R(d, e, a, b, c, F0, K0, 15, 2, x)
-    c, e = R(c, d, e, a, b, F0, K0, 12, 3, x)
-    b, d = R(b, c, d, e, a, F0, K0, 5, 4, x)
-    a, c = R(a, b, c, d, e, F0, K0, 8, 5, x)
-    e, b = R(e, a, b, c, d, F0, K0, 7, 6, x)
-    d, a = R(d, e, a, b, c, F0, K0, 9, 7, x)
-    c, e = R(c, d, e, a, b, F0, K0, 11, 8, x)
-    b, d = R(b, c, d, e, a, F0, K0, 13, 9, x)
-    a, c = R(a, b, c, d, e, F0, K0, 14, 10, x)
-    e, b = R(e, a, b, c, d, F0, K0, 15, 11, x)
-    d, a = R(d, e, a, b, c, F0, K0, 6, 12, x)
-    c, e = R(c, d, e, a, b, F0, K0, 7, 13, x)
-    b, d = R(b, c, d, e, a, F0, K0, 9, 14, x)
-    a, c = R(a, b, c, d, e, F0, K0, 8, 15, x)  # /* #15 */
+    t = (a1 + (b1 ^ c1 ^ d1) + x0) & 0xFFFFFFFF
+    a1 = (((t << 11) | (t >> 21)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + (a1 ^ b1 ^ c1) + x1) & 0xFFFFFFFF
+    e1 = (((t << 14) | (t >> 18)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + (e1 ^ a1 ^ b1) + x2) & 0xFFFFFFFF
+    d1 = (((t << 15) | (t >> 17)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + (d1 ^ e1 ^ a1) + x3) & 0xFFFFFFFF
+    c1 = (((t << 12) | (t >> 20)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + (c1 ^ d1 ^ e1) + x4) & 0xFFFFFFFF
+    b1 = (((t << 5) | (t >> 27)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + (b1 ^ c1 ^ d1) + x5) & 0xFFFFFFFF
+    a1 = (((t << 8) | (t >> 24)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + (a1 ^ b1 ^ c1) + x6) & 0xFFFFFFFF
+    e1 = (((t << 7) | (t >> 25)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + (e1 ^ a1 ^ b1) + x7) & 0xFFFFFFFF
+    d1 = (((t << 9) | (t >> 23)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + (d1 ^ e1 ^ a1) + x8) & 0xFFFFFFFF
+    c1 = (((t << 11) | (t >> 21)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + (c1 ^ d1 ^ e1) + x9) & 0xFFFFFFFF
+    b1 = (((t << 13) | (t >> 19)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + (b1 ^ c1 ^ d1) + x10) & 0xFFFFFFFF
+    a1 = (((t << 14) | (t >> 18)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + (a1 ^ b1 ^ c1) + x11) & 0xFFFFFFFF
+    e1 = (((t << 15) | (t >> 17)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + (e1 ^ a1 ^ b1) + x12) & 0xFFFFFFFF
+    d1 = (((t << 6) | (t >> 26)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + (d1 ^ e1 ^ a1) + x13) & 0xFFFFFFFF
+    c1 = (((t << 7) | (t >> 25)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + (c1 ^ d1 ^ e1) + x14) & 0xFFFFFFFF
+    b1 = (((t << 9) | (t >> 23)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + (b1 ^ c1 ^ d1) + x15) & 0xFFFFFFFF
+    a1 = (((t << 8) | (t >> 24)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
     # /* Round 2 */
-    e, b = R(e, a, b, c, d, F1, K1, 7, 7, x)
-    d, a = R(d, e, a, b, c, F1, K1, 6, 4, x)
-    c, e = R(c, d, e, a, b, F1, K1, 8, 13, x)
-    b, d = R(b, c, d, e, a, F1, K1, 13, 1, x)
-    a, c = R(a, b, c, d, e, F1, K1, 11, 10, x)
-    e, b = R(e, a, b, c, d, F1, K1, 9, 6, x)
-    d, a = R(d, e, a, b, c, F1, K1, 7, 15, x)
-    c, e = R(c, d, e, a, b, F1, K1, 15, 3, x)
-    b, d = R(b, c, d, e, a, F1, K1, 7, 12, x)
-    a, c = R(a, b, c, d, e, F1, K1, 12, 0, x)
-    e, b = R(e, a, b, c, d, F1, K1, 15, 9, x)
-    d, a = R(d, e, a, b, c, F1, K1, 9, 5, x)
-    c, e = R(c, d, e, a, b, F1, K1, 11, 2, x)
-    b, d = R(b, c, d, e, a, F1, K1, 7, 14, x)
-    a, c = R(a, b, c, d, e, F1, K1, 13, 11, x)
-    e, b = R(e, a, b, c, d, F1, K1, 12, 8, x)  # /* #31 */
+    t = (e1 + ((a1 & b1) | (~a1 & c1)) + x7 + K1) & 0xFFFFFFFF
+    e1 = (((t << 7) | (t >> 25)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 & a1) | (~e1 & b1)) + x4 + K1) & 0xFFFFFFFF
+    d1 = (((t << 6) | (t >> 26)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 & e1) | (~d1 & a1)) + x13 + K1) & 0xFFFFFFFF
+    c1 = (((t << 8) | (t >> 24)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 & d1) | (~c1 & e1)) + x1 + K1) & 0xFFFFFFFF
+    b1 = (((t << 13) | (t >> 19)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 & c1) | (~b1 & d1)) + x10 + K1) & 0xFFFFFFFF
+    a1 = (((t << 11) | (t >> 21)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 & b1) | (~a1 & c1)) + x6 + K1) & 0xFFFFFFFF
+    e1 = (((t << 9) | (t >> 23)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 & a1) | (~e1 & b1)) + x15 + K1) & 0xFFFFFFFF
+    d1 = (((t << 7) | (t >> 25)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 & e1) | (~d1 & a1)) + x3 + K1) & 0xFFFFFFFF
+    c1 = (((t << 15) | (t >> 17)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 & d1) | (~c1 & e1)) + x12 + K1) & 0xFFFFFFFF
+    b1 = (((t << 7) | (t >> 25)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 & c1) | (~b1 & d1)) + x0 + K1) & 0xFFFFFFFF
+    a1 = (((t << 12) | (t >> 20)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 & b1) | (~a1 & c1)) + x9 + K1) & 0xFFFFFFFF
+    e1 = (((t << 15) | (t >> 17)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 & a1) | (~e1 & b1)) + x5 + K1) & 0xFFFFFFFF
+    d1 = (((t << 9) | (t >> 23)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 & e1) | (~d1 & a1)) + x2 + K1) & 0xFFFFFFFF
+    c1 = (((t << 11) | (t >> 21)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 & d1) | (~c1 & e1)) + x14 + K1) & 0xFFFFFFFF
+    b1 = (((t << 7) | (t >> 25)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 & c1) | (~b1 & d1)) + x11 + K1) & 0xFFFFFFFF
+    a1 = (((t << 13) | (t >> 19)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 & b1) | (~a1 & c1)) + x8 + K1) & 0xFFFFFFFF
+    e1 = (((t << 12) | (t >> 20)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
     # /* Round 3 */
-    d, a = R(d, e, a, b, c, F2, K2, 11, 3, x)
-    c, e = R(c, d, e, a, b, F2, K2, 13, 10, x)
-    b, d = R(b, c, d, e, a, F2, K2, 6, 14, x)
-    a, c = R(a, b, c, d, e, F2, K2, 7, 4, x)
-    e, b = R(e, a, b, c, d, F2, K2, 14, 9, x)
-    d, a = R(d, e, a, b, c, F2, K2, 9, 15, x)
-    c, e = R(c, d, e, a, b, F2, K2, 13, 8, x)
-    b, d = R(b, c, d, e, a, F2, K2, 15, 1, x)
-    a, c = R(a, b, c, d, e, F2, K2, 14, 2, x)
-    e, b = R(e, a, b, c, d, F2, K2, 8, 7, x)
-    d, a = R(d, e, a, b, c, F2, K2, 13, 0, x)
-    c, e = R(c, d, e, a, b, F2, K2, 6, 6, x)
-    b, d = R(b, c, d, e, a, F2, K2, 5, 13, x)
-    a, c = R(a, b, c, d, e, F2, K2, 12, 11, x)
-    e, b = R(e, a, b, c, d, F2, K2, 7, 5, x)
-    d, a = R(d, e, a, b, c, F2, K2, 5, 12, x)  # /* #47 */
+    t = (d1 + ((e1 | ~a1) ^ b1) + x3 + K2) & 0xFFFFFFFF
+    d1 = (((t << 11) | (t >> 21)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 | ~e1) ^ a1) + x10 + K2) & 0xFFFFFFFF
+    c1 = (((t << 13) | (t >> 19)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 | ~d1) ^ e1) + x14 + K2) & 0xFFFFFFFF
+    b1 = (((t << 6) | (t >> 26)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 | ~c1) ^ d1) + x4 + K2) & 0xFFFFFFFF
+    a1 = (((t << 7) | (t >> 25)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 | ~b1) ^ c1) + x9 + K2) & 0xFFFFFFFF
+    e1 = (((t << 14) | (t >> 18)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 | ~a1) ^ b1) + x15 + K2) & 0xFFFFFFFF
+    d1 = (((t << 9) | (t >> 23)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 | ~e1) ^ a1) + x8 + K2) & 0xFFFFFFFF
+    c1 = (((t << 13) | (t >> 19)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 | ~d1) ^ e1) + x1 + K2) & 0xFFFFFFFF
+    b1 = (((t << 15) | (t >> 17)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 | ~c1) ^ d1) + x2 + K2) & 0xFFFFFFFF
+    a1 = (((t << 14) | (t >> 18)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 | ~b1) ^ c1) + x7 + K2) & 0xFFFFFFFF
+    e1 = (((t << 8) | (t >> 24)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 | ~a1) ^ b1) + x0 + K2) & 0xFFFFFFFF
+    d1 = (((t << 13) | (t >> 19)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 | ~e1) ^ a1) + x6 + K2) & 0xFFFFFFFF
+    c1 = (((t << 6) | (t >> 26)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 | ~d1) ^ e1) + x13 + K2) & 0xFFFFFFFF
+    b1 = (((t << 5) | (t >> 27)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 | ~c1) ^ d1) + x11 + K2) & 0xFFFFFFFF
+    a1 = (((t << 12) | (t >> 20)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 | ~b1) ^ c1) + x5 + K2) & 0xFFFFFFFF
+    e1 = (((t << 7) | (t >> 25)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 | ~a1) ^ b1) + x12 + K2) & 0xFFFFFFFF
+    d1 = (((t << 5) | (t >> 27)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
     # /* Round 4 */
-    c, e = R(c, d, e, a, b, F3, K3, 11, 1, x)
-    b, d = R(b, c, d, e, a, F3, K3, 12, 9, x)
-    a, c = R(a, b, c, d, e, F3, K3, 14, 11, x)
-    e, b = R(e, a, b, c, d, F3, K3, 15, 10, x)
-    d, a = R(d, e, a, b, c, F3, K3, 14, 0, x)
-    c, e = R(c, d, e, a, b, F3, K3, 15, 8, x)
-    b, d = R(b, c, d, e, a, F3, K3, 9, 12, x)
-    a, c = R(a, b, c, d, e, F3, K3, 8, 4, x)
-    e, b = R(e, a, b, c, d, F3, K3, 9, 13, x)
-    d, a = R(d, e, a, b, c, F3, K3, 14, 3, x)
-    c, e = R(c, d, e, a, b, F3, K3, 5, 7, x)
-    b, d = R(b, c, d, e, a, F3, K3, 6, 15, x)
-    a, c = R(a, b, c, d, e, F3, K3, 8, 14, x)
-    e, b = R(e, a, b, c, d, F3, K3, 6, 5, x)
-    d, a = R(d, e, a, b, c, F3, K3, 5, 6, x)
-    c, e = R(c, d, e, a, b, F3, K3, 12, 2, x)  # /* #63 */
+    t = (c1 + ((d1 & a1) | (e1 & ~a1)) + x1 + K3) & 0xFFFFFFFF
+    c1 = (((t << 11) | (t >> 21)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 & e1) | (d1 & ~e1)) + x9 + K3) & 0xFFFFFFFF
+    b1 = (((t << 12) | (t >> 20)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 & d1) | (c1 & ~d1)) + x11 + K3) & 0xFFFFFFFF
+    a1 = (((t << 14) | (t >> 18)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 & c1) | (b1 & ~c1)) + x10 + K3) & 0xFFFFFFFF
+    e1 = (((t << 15) | (t >> 17)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 & b1) | (a1 & ~b1)) + x0 + K3) & 0xFFFFFFFF
+    d1 = (((t << 14) | (t >> 18)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 & a1) | (e1 & ~a1)) + x8 + K3) & 0xFFFFFFFF
+    c1 = (((t << 15) | (t >> 17)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 & e1) | (d1 & ~e1)) + x12 + K3) & 0xFFFFFFFF
+    b1 = (((t << 9) | (t >> 23)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 & d1) | (c1 & ~d1)) + x4 + K3) & 0xFFFFFFFF
+    a1 = (((t << 8) | (t >> 24)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 & c1) | (b1 & ~c1)) + x13 + K3) & 0xFFFFFFFF
+    e1 = (((t << 9) | (t >> 23)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 & b1) | (a1 & ~b1)) + x3 + K3) & 0xFFFFFFFF
+    d1 = (((t << 14) | (t >> 18)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 & a1) | (e1 & ~a1)) + x7 + K3) & 0xFFFFFFFF
+    c1 = (((t << 5) | (t >> 27)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + ((c1 & e1) | (d1 & ~e1)) + x15 + K3) & 0xFFFFFFFF
+    b1 = (((t << 6) | (t >> 26)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + ((b1 & d1) | (c1 & ~d1)) + x14 + K3) & 0xFFFFFFFF
+    a1 = (((t << 8) | (t >> 24)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + ((a1 & c1) | (b1 & ~c1)) + x5 + K3) & 0xFFFFFFFF
+    e1 = (((t << 6) | (t >> 26)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + ((e1 & b1) | (a1 & ~b1)) + x6 + K3) & 0xFFFFFFFF
+    d1 = (((t << 5) | (t >> 27)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + ((d1 & a1) | (e1 & ~a1)) + x2 + K3) & 0xFFFFFFFF
+    c1 = (((t << 12) | (t >> 20)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
     # /* Round 5 */
-    b, d = R(b, c, d, e, a, F4, K4, 9, 4, x)
-    a, c = R(a, b, c, d, e, F4, K4, 15, 0, x)
-    e, b = R(e, a, b, c, d, F4, K4, 5, 5, x)
-    d, a = R(d, e, a, b, c, F4, K4, 11, 9, x)
-    c, e = R(c, d, e, a, b, F4, K4, 6, 7, x)
-    b, d = R(b, c, d, e, a, F4, K4, 8, 12, x)
-    a, c = R(a, b, c, d, e, F4, K4, 13, 2, x)
-    e, b = R(e, a, b, c, d, F4, K4, 12, 10, x)
-    d, a = R(d, e, a, b, c, F4, K4, 5, 14, x)
-    c, e = R(c, d, e, a, b, F4, K4, 12, 1, x)
-    b, d = R(b, c, d, e, a, F4, K4, 13, 3, x)
-    a, c = R(a, b, c, d, e, F4, K4, 14, 8, x)
-    e, b = R(e, a, b, c, d, F4, K4, 11, 11, x)
-    d, a = R(d, e, a, b, c, F4, K4, 8, 6, x)
-    c, e = R(c, d, e, a, b, F4, K4, 5, 15, x)
-    b, d = R(b, c, d, e, a, F4, K4, 6, 13, x)  # /* #79 */
-
-    aa = a
-    bb = b
-    cc = c
-    dd = d
-    ee = e
-
-    a = state[0]
-    b = state[1]
-    c = state[2]
-    d = state[3]
-    e = state[4]
-
+    t = (b1 + (c1 ^ (d1 | ~e1)) + x4 + K4) & 0xFFFFFFFF
+    b1 = (((t << 9) | (t >> 23)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + (b1 ^ (c1 | ~d1)) + x0 + K4) & 0xFFFFFFFF
+    a1 = (((t << 15) | (t >> 17)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + (a1 ^ (b1 | ~c1)) + x5 + K4) & 0xFFFFFFFF
+    e1 = (((t << 5) | (t >> 27)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + (e1 ^ (a1 | ~b1)) + x9 + K4) & 0xFFFFFFFF
+    d1 = (((t << 11) | (t >> 21)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + (d1 ^ (e1 | ~a1)) + x7 + K4) & 0xFFFFFFFF
+    c1 = (((t << 6) | (t >> 26)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + (c1 ^ (d1 | ~e1)) + x12 + K4) & 0xFFFFFFFF
+    b1 = (((t << 8) | (t >> 24)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + (b1 ^ (c1 | ~d1)) + x2 + K4) & 0xFFFFFFFF
+    a1 = (((t << 13) | (t >> 19)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + (a1 ^ (b1 | ~c1)) + x10 + K4) & 0xFFFFFFFF
+    e1 = (((t << 12) | (t >> 20)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + (e1 ^ (a1 | ~b1)) + x14 + K4) & 0xFFFFFFFF
+    d1 = (((t << 5) | (t >> 27)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + (d1 ^ (e1 | ~a1)) + x1 + K4) & 0xFFFFFFFF
+    c1 = (((t << 12) | (t >> 20)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + (c1 ^ (d1 | ~e1)) + x3 + K4) & 0xFFFFFFFF
+    b1 = (((t << 13) | (t >> 19)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
+    t = (a1 + (b1 ^ (c1 | ~d1)) + x8 + K4) & 0xFFFFFFFF
+    a1 = (((t << 14) | (t >> 18)) + e1) & 0xFFFFFFFF
+    c1 = ((c1 << 10) | (c1 >> 22)) & 0xFFFFFFFF
+    t = (e1 + (a1 ^ (b1 | ~c1)) + x11 + K4) & 0xFFFFFFFF
+    e1 = (((t << 11) | (t >> 21)) + d1) & 0xFFFFFFFF
+    b1 = ((b1 << 10) | (b1 >> 22)) & 0xFFFFFFFF
+    t = (d1 + (e1 ^ (a1 | ~b1)) + x6 + K4) & 0xFFFFFFFF
+    d1 = (((t << 8) | (t >> 24)) + c1) & 0xFFFFFFFF
+    a1 = ((a1 << 10) | (a1 >> 22)) & 0xFFFFFFFF
+    t = (c1 + (d1 ^ (e1 | ~a1)) + x15 + K4) & 0xFFFFFFFF
+    c1 = (((t << 5) | (t >> 27)) + b1) & 0xFFFFFFFF
+    e1 = ((e1 << 10) | (e1 >> 22)) & 0xFFFFFFFF
+    t = (b1 + (c1 ^ (d1 | ~e1)) + x13 + K4) & 0xFFFFFFFF
+    b1 = (((t << 6) | (t >> 26)) + a1) & 0xFFFFFFFF
+    d1 = ((d1 << 10) | (d1 >> 22)) & 0xFFFFFFFF
     # /* Parallel round 1 */
-    a, c = R(a, b, c, d, e, F4, KK0, 8, 5, x)
-    e, b = R(e, a, b, c, d, F4, KK0, 9, 14, x)
-    d, a = R(d, e, a, b, c, F4, KK0, 9, 7, x)
-    c, e = R(c, d, e, a, b, F4, KK0, 11, 0, x)
-    b, d = R(b, c, d, e, a, F4, KK0, 13, 9, x)
-    a, c = R(a, b, c, d, e, F4, KK0, 15, 2, x)
-    e, b = R(e, a, b, c, d, F4, KK0, 15, 11, x)
-    d, a = R(d, e, a, b, c, F4, KK0, 5, 4, x)
-    c, e = R(c, d, e, a, b, F4, KK0, 7, 13, x)
-    b, d = R(b, c, d, e, a, F4, KK0, 7, 6, x)
-    a, c = R(a, b, c, d, e, F4, KK0, 8, 15, x)
-    e, b = R(e, a, b, c, d, F4, KK0, 11, 8, x)
-    d, a = R(d, e, a, b, c, F4, KK0, 14, 1, x)
-    c, e = R(c, d, e, a, b, F4, KK0, 14, 10, x)
-    b, d = R(b, c, d, e, a, F4, KK0, 12, 3, x)
-    a, c = R(a, b, c, d, e, F4, KK0, 6, 12, x)  # /* #15 */
+    t = (a2 + (b2 ^ (c2 | ~d2)) + x5 + KK0) & 0xFFFFFFFF
+    a2 = (((t << 8) | (t >> 24)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + (a2 ^ (b2 | ~c2)) + x14 + KK0) & 0xFFFFFFFF
+    e2 = (((t << 9) | (t >> 23)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + (e2 ^ (a2 | ~b2)) + x7 + KK0) & 0xFFFFFFFF
+    d2 = (((t << 9) | (t >> 23)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + (d2 ^ (e2 | ~a2)) + x0 + KK0) & 0xFFFFFFFF
+    c2 = (((t << 11) | (t >> 21)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + (c2 ^ (d2 | ~e2)) + x9 + KK0) & 0xFFFFFFFF
+    b2 = (((t << 13) | (t >> 19)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + (b2 ^ (c2 | ~d2)) + x2 + KK0) & 0xFFFFFFFF
+    a2 = (((t << 15) | (t >> 17)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + (a2 ^ (b2 | ~c2)) + x11 + KK0) & 0xFFFFFFFF
+    e2 = (((t << 15) | (t >> 17)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + (e2 ^ (a2 | ~b2)) + x4 + KK0) & 0xFFFFFFFF
+    d2 = (((t << 5) | (t >> 27)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + (d2 ^ (e2 | ~a2)) + x13 + KK0) & 0xFFFFFFFF
+    c2 = (((t << 7) | (t >> 25)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + (c2 ^ (d2 | ~e2)) + x6 + KK0) & 0xFFFFFFFF
+    b2 = (((t << 7) | (t >> 25)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + (b2 ^ (c2 | ~d2)) + x15 + KK0) & 0xFFFFFFFF
+    a2 = (((t << 8) | (t >> 24)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + (a2 ^ (b2 | ~c2)) + x8 + KK0) & 0xFFFFFFFF
+    e2 = (((t << 11) | (t >> 21)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + (e2 ^ (a2 | ~b2)) + x1 + KK0) & 0xFFFFFFFF
+    d2 = (((t << 14) | (t >> 18)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + (d2 ^ (e2 | ~a2)) + x10 + KK0) & 0xFFFFFFFF
+    c2 = (((t << 14) | (t >> 18)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + (c2 ^ (d2 | ~e2)) + x3 + KK0) & 0xFFFFFFFF
+    b2 = (((t << 12) | (t >> 20)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + (b2 ^ (c2 | ~d2)) + x12 + KK0) & 0xFFFFFFFF
+    a2 = (((t << 6) | (t >> 26)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
     # /* Parallel round 2 */
-    e, b = R(e, a, b, c, d, F3, KK1, 9, 6, x)
-    d, a = R(d, e, a, b, c, F3, KK1, 13, 11, x)
-    c, e = R(c, d, e, a, b, F3, KK1, 15, 3, x)
-    b, d = R(b, c, d, e, a, F3, KK1, 7, 7, x)
-    a, c = R(a, b, c, d, e, F3, KK1, 12, 0, x)
-    e, b = R(e, a, b, c, d, F3, KK1, 8, 13, x)
-    d, a = R(d, e, a, b, c, F3, KK1, 9, 5, x)
-    c, e = R(c, d, e, a, b, F3, KK1, 11, 10, x)
-    b, d = R(b, c, d, e, a, F3, KK1, 7, 14, x)
-    a, c = R(a, b, c, d, e, F3, KK1, 7, 15, x)
-    e, b = R(e, a, b, c, d, F3, KK1, 12, 8, x)
-    d, a = R(d, e, a, b, c, F3, KK1, 7, 12, x)
-    c, e = R(c, d, e, a, b, F3, KK1, 6, 4, x)
-    b, d = R(b, c, d, e, a, F3, KK1, 15, 9, x)
-    a, c = R(a, b, c, d, e, F3, KK1, 13, 1, x)
-    e, b = R(e, a, b, c, d, F3, KK1, 11, 2, x)  # /* #31 */
+    t = (e2 + ((a2 & c2) | (b2 & ~c2)) + x6 + KK1) & 0xFFFFFFFF
+    e2 = (((t << 9) | (t >> 23)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 & b2) | (a2 & ~b2)) + x11 + KK1) & 0xFFFFFFFF
+    d2 = (((t << 13) | (t >> 19)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 & a2) | (e2 & ~a2)) + x3 + KK1) & 0xFFFFFFFF
+    c2 = (((t << 15) | (t >> 17)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 & e2) | (d2 & ~e2)) + x7 + KK1) & 0xFFFFFFFF
+    b2 = (((t << 7) | (t >> 25)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 & d2) | (c2 & ~d2)) + x0 + KK1) & 0xFFFFFFFF
+    a2 = (((t << 12) | (t >> 20)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 & c2) | (b2 & ~c2)) + x13 + KK1) & 0xFFFFFFFF
+    e2 = (((t << 8) | (t >> 24)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 & b2) | (a2 & ~b2)) + x5 + KK1) & 0xFFFFFFFF
+    d2 = (((t << 9) | (t >> 23)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 & a2) | (e2 & ~a2)) + x10 + KK1) & 0xFFFFFFFF
+    c2 = (((t << 11) | (t >> 21)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 & e2) | (d2 & ~e2)) + x14 + KK1) & 0xFFFFFFFF
+    b2 = (((t << 7) | (t >> 25)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 & d2) | (c2 & ~d2)) + x15 + KK1) & 0xFFFFFFFF
+    a2 = (((t << 7) | (t >> 25)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 & c2) | (b2 & ~c2)) + x8 + KK1) & 0xFFFFFFFF
+    e2 = (((t << 12) | (t >> 20)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 & b2) | (a2 & ~b2)) + x12 + KK1) & 0xFFFFFFFF
+    d2 = (((t << 7) | (t >> 25)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 & a2) | (e2 & ~a2)) + x4 + KK1) & 0xFFFFFFFF
+    c2 = (((t << 6) | (t >> 26)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 & e2) | (d2 & ~e2)) + x9 + KK1) & 0xFFFFFFFF
+    b2 = (((t << 15) | (t >> 17)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 & d2) | (c2 & ~d2)) + x1 + KK1) & 0xFFFFFFFF
+    a2 = (((t << 13) | (t >> 19)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 & c2) | (b2 & ~c2)) + x2 + KK1) & 0xFFFFFFFF
+    e2 = (((t << 11) | (t >> 21)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
     # /* Parallel round 3 */
-    d, a = R(d, e, a, b, c, F2, KK2, 9, 15, x)
-    c, e = R(c, d, e, a, b, F2, KK2, 7, 5, x)
-    b, d = R(b, c, d, e, a, F2, KK2, 15, 1, x)
-    a, c = R(a, b, c, d, e, F2, KK2, 11, 3, x)
-    e, b = R(e, a, b, c, d, F2, KK2, 8, 7, x)
-    d, a = R(d, e, a, b, c, F2, KK2, 6, 14, x)
-    c, e = R(c, d, e, a, b, F2, KK2, 6, 6, x)
-    b, d = R(b, c, d, e, a, F2, KK2, 14, 9, x)
-    a, c = R(a, b, c, d, e, F2, KK2, 12, 11, x)
-    e, b = R(e, a, b, c, d, F2, KK2, 13, 8, x)
-    d, a = R(d, e, a, b, c, F2, KK2, 5, 12, x)
-    c, e = R(c, d, e, a, b, F2, KK2, 14, 2, x)
-    b, d = R(b, c, d, e, a, F2, KK2, 13, 10, x)
-    a, c = R(a, b, c, d, e, F2, KK2, 13, 0, x)
-    e, b = R(e, a, b, c, d, F2, KK2, 7, 4, x)
-    d, a = R(d, e, a, b, c, F2, KK2, 5, 13, x)  # /* #47 */
+    t = (d2 + ((e2 | ~a2) ^ b2) + x15 + KK2) & 0xFFFFFFFF
+    d2 = (((t << 9) | (t >> 23)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 | ~e2) ^ a2) + x5 + KK2) & 0xFFFFFFFF
+    c2 = (((t << 7) | (t >> 25)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 | ~d2) ^ e2) + x1 + KK2) & 0xFFFFFFFF
+    b2 = (((t << 15) | (t >> 17)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 | ~c2) ^ d2) + x3 + KK2) & 0xFFFFFFFF
+    a2 = (((t << 11) | (t >> 21)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 | ~b2) ^ c2) + x7 + KK2) & 0xFFFFFFFF
+    e2 = (((t << 8) | (t >> 24)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 | ~a2) ^ b2) + x14 + KK2) & 0xFFFFFFFF
+    d2 = (((t << 6) | (t >> 26)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 | ~e2) ^ a2) + x6 + KK2) & 0xFFFFFFFF
+    c2 = (((t << 6) | (t >> 26)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 | ~d2) ^ e2) + x9 + KK2) & 0xFFFFFFFF
+    b2 = (((t << 14) | (t >> 18)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 | ~c2) ^ d2) + x11 + KK2) & 0xFFFFFFFF
+    a2 = (((t << 12) | (t >> 20)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 | ~b2) ^ c2) + x8 + KK2) & 0xFFFFFFFF
+    e2 = (((t << 13) | (t >> 19)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 | ~a2) ^ b2) + x12 + KK2) & 0xFFFFFFFF
+    d2 = (((t << 5) | (t >> 27)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 | ~e2) ^ a2) + x2 + KK2) & 0xFFFFFFFF
+    c2 = (((t << 14) | (t >> 18)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 | ~d2) ^ e2) + x10 + KK2) & 0xFFFFFFFF
+    b2 = (((t << 13) | (t >> 19)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 | ~c2) ^ d2) + x0 + KK2) & 0xFFFFFFFF
+    a2 = (((t << 13) | (t >> 19)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 | ~b2) ^ c2) + x4 + KK2) & 0xFFFFFFFF
+    e2 = (((t << 7) | (t >> 25)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 | ~a2) ^ b2) + x13 + KK2) & 0xFFFFFFFF
+    d2 = (((t << 5) | (t >> 27)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
     # /* Parallel round 4 */
-    c, e = R(c, d, e, a, b, F1, KK3, 15, 8, x)
-    b, d = R(b, c, d, e, a, F1, KK3, 5, 6, x)
-    a, c = R(a, b, c, d, e, F1, KK3, 8, 4, x)
-    e, b = R(e, a, b, c, d, F1, KK3, 11, 1, x)
-    d, a = R(d, e, a, b, c, F1, KK3, 14, 3, x)
-    c, e = R(c, d, e, a, b, F1, KK3, 14, 11, x)
-    b, d = R(b, c, d, e, a, F1, KK3, 6, 15, x)
-    a, c = R(a, b, c, d, e, F1, KK3, 14, 0, x)
-    e, b = R(e, a, b, c, d, F1, KK3, 6, 5, x)
-    d, a = R(d, e, a, b, c, F1, KK3, 9, 12, x)
-    c, e = R(c, d, e, a, b, F1, KK3, 12, 2, x)
-    b, d = R(b, c, d, e, a, F1, KK3, 9, 13, x)
-    a, c = R(a, b, c, d, e, F1, KK3, 12, 9, x)
-    e, b = R(e, a, b, c, d, F1, KK3, 5, 7, x)
-    d, a = R(d, e, a, b, c, F1, KK3, 15, 10, x)
-    c, e = R(c, d, e, a, b, F1, KK3, 8, 14, x)  # /* #63 */
+    t = (c2 + ((d2 & e2) | (~d2 & a2)) + x8 + KK3) & 0xFFFFFFFF
+    c2 = (((t << 15) | (t >> 17)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 & d2) | (~c2 & e2)) + x6 + KK3) & 0xFFFFFFFF
+    b2 = (((t << 5) | (t >> 27)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 & c2) | (~b2 & d2)) + x4 + KK3) & 0xFFFFFFFF
+    a2 = (((t << 8) | (t >> 24)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 & b2) | (~a2 & c2)) + x1 + KK3) & 0xFFFFFFFF
+    e2 = (((t << 11) | (t >> 21)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 & a2) | (~e2 & b2)) + x3 + KK3) & 0xFFFFFFFF
+    d2 = (((t << 14) | (t >> 18)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 & e2) | (~d2 & a2)) + x11 + KK3) & 0xFFFFFFFF
+    c2 = (((t << 14) | (t >> 18)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 & d2) | (~c2 & e2)) + x15 + KK3) & 0xFFFFFFFF
+    b2 = (((t << 6) | (t >> 26)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 & c2) | (~b2 & d2)) + x0 + KK3) & 0xFFFFFFFF
+    a2 = (((t << 14) | (t >> 18)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 & b2) | (~a2 & c2)) + x5 + KK3) & 0xFFFFFFFF
+    e2 = (((t << 6) | (t >> 26)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 & a2) | (~e2 & b2)) + x12 + KK3) & 0xFFFFFFFF
+    d2 = (((t << 9) | (t >> 23)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 & e2) | (~d2 & a2)) + x2 + KK3) & 0xFFFFFFFF
+    c2 = (((t << 12) | (t >> 20)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + ((c2 & d2) | (~c2 & e2)) + x13 + KK3) & 0xFFFFFFFF
+    b2 = (((t << 9) | (t >> 23)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + ((b2 & c2) | (~b2 & d2)) + x9 + KK3) & 0xFFFFFFFF
+    a2 = (((t << 12) | (t >> 20)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + ((a2 & b2) | (~a2 & c2)) + x7 + KK3) & 0xFFFFFFFF
+    e2 = (((t << 5) | (t >> 27)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + ((e2 & a2) | (~e2 & b2)) + x10 + KK3) & 0xFFFFFFFF
+    d2 = (((t << 15) | (t >> 17)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + ((d2 & e2) | (~d2 & a2)) + x14 + KK3) & 0xFFFFFFFF
+    c2 = (((t << 8) | (t >> 24)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
     # /* Parallel round 5 */
-    b, d = R(b, c, d, e, a, F0, KK4, 8, 12, x)
-    a, c = R(a, b, c, d, e, F0, KK4, 5, 15, x)
-    e, b = R(e, a, b, c, d, F0, KK4, 12, 10, x)
-    d, a = R(d, e, a, b, c, F0, KK4, 9, 4, x)
-    c, e = R(c, d, e, a, b, F0, KK4, 12, 1, x)
-    b, d = R(b, c, d, e, a, F0, KK4, 5, 5, x)
-    a, c = R(a, b, c, d, e, F0, KK4, 14, 8, x)
-    e, b = R(e, a, b, c, d, F0, KK4, 6, 7, x)
-    d, a = R(d, e, a, b, c, F0, KK4, 8, 6, x)
-    c, e = R(c, d, e, a, b, F0, KK4, 13, 2, x)
-    b, d = R(b, c, d, e, a, F0, KK4, 6, 13, x)
-    a, c = R(a, b, c, d, e, F0, KK4, 5, 14, x)
-    e, b = R(e, a, b, c, d, F0, KK4, 15, 0, x)
-    d, a = R(d, e, a, b, c, F0, KK4, 13, 3, x)
-    c, e = R(c, d, e, a, b, F0, KK4, 11, 9, x)
-    b, d = R(b, c, d, e, a, F0, KK4, 11, 11, x)  # /* #79 */
-
-    t = (state[1] + cc + d) % 0x100000000
-    state[1] = (state[2] + dd + e) % 0x100000000
-    state[2] = (state[3] + ee + a) % 0x100000000
-    state[3] = (state[4] + aa + b) % 0x100000000
-    state[4] = (state[0] + bb + c) % 0x100000000
-    state[0] = t % 0x100000000
+    t = (b2 + (c2 ^ d2 ^ e2) + x12) & 0xFFFFFFFF
+    b2 = (((t << 8) | (t >> 24)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + (b2 ^ c2 ^ d2) + x15) & 0xFFFFFFFF
+    a2 = (((t << 5) | (t >> 27)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + (a2 ^ b2 ^ c2) + x10) & 0xFFFFFFFF
+    e2 = (((t << 12) | (t >> 20)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + (e2 ^ a2 ^ b2) + x4) & 0xFFFFFFFF
+    d2 = (((t << 9) | (t >> 23)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + (d2 ^ e2 ^ a2) + x1) & 0xFFFFFFFF
+    c2 = (((t << 12) | (t >> 20)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + (c2 ^ d2 ^ e2) + x5) & 0xFFFFFFFF
+    b2 = (((t << 5) | (t >> 27)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + (b2 ^ c2 ^ d2) + x8) & 0xFFFFFFFF
+    a2 = (((t << 14) | (t >> 18)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + (a2 ^ b2 ^ c2) + x7) & 0xFFFFFFFF
+    e2 = (((t << 6) | (t >> 26)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + (e2 ^ a2 ^ b2) + x6) & 0xFFFFFFFF
+    d2 = (((t << 8) | (t >> 24)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + (d2 ^ e2 ^ a2) + x2) & 0xFFFFFFFF
+    c2 = (((t << 13) | (t >> 19)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + (c2 ^ d2 ^ e2) + x13) & 0xFFFFFFFF
+    b2 = (((t << 6) | (t >> 26)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+    t = (a2 + (b2 ^ c2 ^ d2) + x14) & 0xFFFFFFFF
+    a2 = (((t << 5) | (t >> 27)) + e2) & 0xFFFFFFFF
+    c2 = ((c2 << 10) | (c2 >> 22)) & 0xFFFFFFFF
+    t = (e2 + (a2 ^ b2 ^ c2) + x0) & 0xFFFFFFFF
+    e2 = (((t << 15) | (t >> 17)) + d2) & 0xFFFFFFFF
+    b2 = ((b2 << 10) | (b2 >> 22)) & 0xFFFFFFFF
+    t = (d2 + (e2 ^ a2 ^ b2) + x3) & 0xFFFFFFFF
+    d2 = (((t << 13) | (t >> 19)) + c2) & 0xFFFFFFFF
+    a2 = ((a2 << 10) | (a2 >> 22)) & 0xFFFFFFFF
+    t = (c2 + (d2 ^ e2 ^ a2) + x9) & 0xFFFFFFFF
+    c2 = (((t << 11) | (t >> 21)) + b2) & 0xFFFFFFFF
+    e2 = ((e2 << 10) | (e2 >> 22)) & 0xFFFFFFFF
+    t = (b2 + (c2 ^ d2 ^ e2) + x11) & 0xFFFFFFFF
+    b2 = (((t << 11) | (t >> 21)) + a2) & 0xFFFFFFFF
+    d2 = ((d2 << 10) | (d2 >> 22)) & 0xFFFFFFFF
+
+    t = (state[1] + c1 + d2) & 0xFFFFFFFF
+    state[1] = (state[2] + d1 + e2) & 0xFFFFFFFF
+    state[2] = (state[3] + e1 + a2) & 0xFFFFFFFF
+    state[3] = (state[4] + a1 + b2) & 0xFFFFFFFF
+    state[4] = (state[0] + b1 + c2) & 0xFFFFFFFF
+    state[0] = t
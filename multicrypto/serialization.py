@@ -0,0 +1,30 @@
+class TransactionWriter:
+    def __init__(self, size=0):
+        """
+        Writer serializing transaction data into single bytearray. When the size is known
+        the buffer is allocated once, otherwise it grows with written data.
+        :param size: Expected size of serialized data in bytes
+        """
+        self.buffer = bytearray(size)
+        self.position = 0
+
+    def __len__(self):
+        return self.position
+
+    def write(self, data):
+        end = self.position + len(data)
+        self.buffer[self.position : end] = data
+        self.position = end
+
+    def getbuffer(self):
+        """
+        Return memoryview of written data without copying it, it can be passed directly to
+        hash functions. View must be released before writing more data than preallocated.
+        """
+        return memoryview(self.buffer)[: self.position]
+
+    def getvalue(self):
+        return bytes(self.getbuffer())
+
+    def hex(self):
+        return self.getbuffer().hex()
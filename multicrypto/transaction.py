@@ -1,11 +1,12 @@
 import logging
 import time
 
-from multicrypto.address import decompose_address, encode_point, calculate_public_key_hash
+from multicrypto.address import decompose_address, derive_public_key_data
 from multicrypto.consts import OP_0
 from multicrypto.ecdsa import sign
 from multicrypto.ellipticcurve import secp256k1
 from multicrypto.scripts import P2PKH_SCRIPT, P2SH_SCRIPT, is_p2sh
+from multicrypto.serialization import TransactionWriter
 from multicrypto.utils import (
     int_to_bytes,
     hex_to_bytes,
@@ -17,7 +18,22 @@ from multicrypto.utils import (
 logger = logging.getLogger(__name__)
 
 
+def sign_data(message, private_key):
+    """ECDSA signing of data to sign, defined at module level so it can run in process pool"""
+    return sign(message, private_key, secp256k1, double_sha256)
+
+
 class TransactionInput:
+    __slots__ = (
+        'transaction_id',
+        'output_index',
+        'script',
+        'satoshis',
+        'private_key',
+        'encoded_public_key',
+        'unlocking_script',
+    )
+
     def __init__(
         self,
         transaction_id,
@@ -28,6 +44,7 @@ class TransactionInput:
         unlocking_script=None,
     ):
         """
+        Input keeps only canonical fields, encoded forms are derived when input is written.
         :param transaction_id: Transaction id in hex format
         :param output_index: Number (int) specifying the output of the transaction which
                              becomes new transaction input
@@ -36,44 +53,73 @@ class TransactionInput:
         :param private_key: Private key (int) needed to claim the input
         """
         self.transaction_id = hex_to_bytes(transaction_id, byteorder='big')
-        self.output_index = output_index.to_bytes(4, byteorder='little')
+        self.output_index = output_index
         self.script = hex_to_bytes(locking_script, byteorder='big')
-        self.script_length = int_to_bytes(len(self.script), byteorder='little')
-        self.satoshis = satoshis.to_bytes(8, byteorder='little')
+        self.satoshis = satoshis
+        self.private_key = private_key
+        self.encoded_public_key = None
         if private_key:
-            self.private_key = private_key
-            self.public_key = private_key * secp256k1.G
-            compressed_public_key_hash = calculate_public_key_hash(
-                self.public_key, compressed=True
-            )
-            if compressed_public_key_hash.hex() not in locking_script:
-                is_compressed_public_key = False
-            else:
-                is_compressed_public_key = True
-            self.encoded_public_key = encode_point(
-                self.public_key, compressed=is_compressed_public_key
-            )
-            self.public_key_len = len(self.encoded_public_key).to_bytes(1, byteorder='little')
+            _, encoded_public_keys, public_key_hashes = derive_public_key_data(private_key)
+            is_compressed_public_key = public_key_hashes[True].hex() in locking_script
+            self.encoded_public_key = encoded_public_keys[is_compressed_public_key]
         self.unlocking_script = hex_to_bytes(unlocking_script, byteorder='big')
 
-    def get_encoded(self, with_script):
-        input_data = self.transaction_id + self.output_index
+    @property
+    def public_key(self):
+        return derive_public_key_data(self.private_key)[0] if self.private_key else None
+
+    @property
+    def public_key_len(self):
+        return len(self.encoded_public_key).to_bytes(1, byteorder='little')
+
+    @property
+    def script_length(self):
+        return int_to_bytes(len(self.script), byteorder='little')
+
+    def get_size(self, with_script):
+        script_size = len(self.script_length) + len(self.script) if with_script else len(OP_0)
+        return len(self.transaction_id) + 4 + script_size
+
+    def write(self, writer, with_script):
+        writer.write(self.transaction_id)
+        writer.write(self.output_index.to_bytes(4, byteorder='little'))
         if with_script:
-            input_data += self.script_length + self.script
+            writer.write(self.script_length)
+            writer.write(self.script)
         else:
-            input_data += OP_0
-        return input_data
+            writer.write(OP_0)
+
+    def get_encoded(self, with_script):
+        writer = TransactionWriter(self.get_size(with_script))
+        self.write(writer, with_script)
+        return writer.getvalue()
 
 
 class TransactionOutput:
+    __slots__ = ('address', 'satoshis', 'script')
+
     def __init__(self, address, satoshis, coin):
         self.satoshis = satoshis
         self.address = address
-        self.prefix, self.address_digest = decompose_address(address, coin)
-        if self.prefix == coin['script_prefix_bytes']:
-            self.script = P2SH_SCRIPT % self.address_digest
+        prefix, address_digest = decompose_address(address, coin)
+        if prefix == coin['script_prefix_bytes']:
+            self.script = P2SH_SCRIPT % address_digest
         else:
-            self.script = P2PKH_SCRIPT % self.address_digest
+            self.script = P2PKH_SCRIPT % address_digest
+
+    def get_size(self, script_suffix=b''):
+        script_size = len(self.script) + len(script_suffix)
+        return 8 + len(int_to_bytes(script_size, byteorder='little')) + script_size
+
+    def write(self, writer, script_suffix=b''):
+        """
+        :param writer: TransactionWriter
+        :param script_suffix: Data appended to the locking script (i.e. replay protection)
+        """
+        writer.write(self.satoshis.to_bytes(8, byteorder='little'))
+        writer.write(int_to_bytes(len(self.script) + len(script_suffix), byteorder='little'))
+        writer.write(self.script)
+        writer.write(script_suffix)
 
 
 class Transaction:
@@ -103,63 +149,124 @@ class Transaction:
             for output in outputs
         ]
         self.outputs_counter = int_to_bytes(len(self.outputs), byteorder='little')
+        self.signing_segments = None
 
-    def get_encoded_inputs(self, position):
-        input_block = b''
+    def write_inputs(self, writer, position):
         for i, inp in enumerate(self.inputs):
-            if i in position:
-                input_block += inp.get_encoded(with_script=True)
-            else:
-                input_block += inp.get_encoded(with_script=False)
-            input_block += self.sequence
-        return input_block
+            inp.write(writer, with_script=i in position)
+            writer.write(self.sequence)
 
-    def get_encoded_outputs(self):
-        output_block = b''
+    def get_encoded_inputs(self, position):
+        writer = TransactionWriter()
+        self.write_inputs(writer, position)
+        return writer.getvalue()
+
+    def get_script_suffix(self):
+        """Return replay protection data appended to output scripts (empty if not used)"""
+        if not self.history_block:
+            return b''
+        height_bytes = int_to_bytes(self.history_block['height'], byteorder='little')
+        return (
+            b'\x20'
+            + hex_to_bytes(self.history_block['hash'], byteorder='little')
+            + len(height_bytes).to_bytes(1, byteorder='big')
+            + height_bytes
+            + b'\xb4'
+        )
+
+    def write_outputs(self, writer):
+        script_suffix = self.get_script_suffix()
         for output in self.outputs:
-            script = output.script
-            if self.history_block:
-                script += b'\x20' + hex_to_bytes(self.history_block['hash'], byteorder='little')
-                height_bytes = int_to_bytes(self.history_block['height'], byteorder='little')
-                script += len(height_bytes).to_bytes(1, byteorder='big') + height_bytes + b'\xb4'
-            output_block += output.satoshis.to_bytes(8, byteorder='little')
-            output_block += int_to_bytes(len(script), byteorder='little')
-            output_block += script
-        return output_block
+            output.write(writer, script_suffix)
 
-    def get_data_to_sign(self, position):
-        data = (
+    def get_encoded_outputs(self):
+        writer = TransactionWriter()
+        self.write_outputs(writer)
+        return writer.getvalue()
+
+    def get_size(self):
+        """Return size of the raw transaction in bytes"""
+        script_suffix = self.get_script_suffix()
+        return (
+            len(self.get_encoded_prefix())
+            + sum(inp.get_size(with_script=True) + len(self.sequence) for inp in self.inputs)
+            + len(self.outputs_counter)
+            + sum(output.get_size(script_suffix) for output in self.outputs)
+            + len(self.lock_time)
+        )
+
+    def get_encoded_prefix(self):
+        return (
             # Four-byte version field
             self.version
-            +
             # One-byte varint specifying the number of inputs
-            self.inputs_counter
-            +
-            # Inputs
-            self.get_encoded_inputs([position])
-            +
-            # One-byte varint containing the number of outputs in our new transaction
-            self.outputs_counter
-            +
-            # Outputs
-            self.get_encoded_outputs()
-            +
-            # Four-byte "lock time" field
-            self.lock_time
-            +
-            # Four-byte "hash code type"
-            self.hash_type
+            + self.inputs_counter
+        )
+
+    def get_signing_segments(self):
+        """
+        Serialize once parts of data to sign which are shared by all inputs, so data to sign
+        for every input is joined from cached segments instead of encoding whole transaction.
+        Inputs are encoded before any of them is signed (signing replaces input script).
+        :return: Tuple (prefix, inputs without script, inputs with script, suffix)
+        """
+        if self.signing_segments is None:
+            self.signing_segments = (
+                self.get_encoded_prefix(),
+                [inp.get_encoded(with_script=False) + self.sequence for inp in self.inputs],
+                [inp.get_encoded(with_script=True) + self.sequence for inp in self.inputs],
+                # One-byte varint containing the number of outputs in our new transaction
+                self.outputs_counter
+                # Outputs
+                + self.get_encoded_outputs()
+                # Four-byte "lock time" field
+                + self.lock_time
+                # Four-byte "hash code type"
+                + self.hash_type,
+            )
+        return self.signing_segments
+
+    def get_data_to_sign(self, position):
+        prefix, encoded_inputs, encoded_inputs_with_script, suffix = self.get_signing_segments()
+        return b''.join(
+            [
+                prefix,
+                *encoded_inputs[:position],
+                # Only signed input contains locking script
+                encoded_inputs_with_script[position],
+                *encoded_inputs[position + 1 :],
+                suffix,
+            ]
         )
-        return data
 
     def sign_input(self, position):
+        self.get_signing_segments()  # segments must be cached before input script is replaced
         inp = self.inputs[position]
         if is_p2sh(inp.script):
             inp.script = inp.unlocking_script
-            inp.script_length = int_to_bytes(len(inp.script), byteorder='little')
             return
         message = self.get_data_to_sign(position)
-        sig = sign(message, inp.private_key, secp256k1, double_sha256)  # ECDSA signing
+        self.set_signature(position, sign_data(message, inp.private_key))
+
+    def sign_inputs(self, executor):
+        """
+        Sign all inputs using executor (i.e. concurrent.futures.ProcessPoolExecutor). Data to
+        sign is prepared up front and only ECDSA signing runs in the executor.
+        """
+        self.get_signing_segments()
+        positions = []
+        for position, inp in enumerate(self.inputs):
+            if is_p2sh(inp.script):
+                self.sign_input(position)
+            else:
+                positions.append(position)
+        messages = [self.get_data_to_sign(position) for position in positions]
+        private_keys = [self.inputs[position].private_key for position in positions]
+        for position, sig in zip(positions, executor.map(sign_data, messages, private_keys)):
+            self.set_signature(position, sig)
+
+    def set_signature(self, position, sig):
+        inp = self.inputs[position]
         encoded_signature = der_encode_signature(sig)
         signature = encoded_signature + self.coin.get('sig_hash', b'\x01')
         script_sig = (
@@ -169,23 +276,29 @@ class Transaction:
             + inp.encoded_public_key
         )
         inp.script = script_sig
-        inp.script_length = int_to_bytes(len(script_sig), byteorder='little')
 
-    def create(self):
+    def create(self, executor=None):
+        """
+        Sign inputs and serialize the transaction.
+        :param executor: Optional executor (i.e. concurrent.futures.ProcessPoolExecutor) signing
+                         inputs in parallel, result is the same as of sequential signing
+        :return: Raw transaction in hex format
+        """
         if self.id:
             raise Exception(f'Transaction {self.id} already created')
-        for i in range(len(self.inputs)):
-            self.sign_input(i)
-        raw_transaction_data = (
-            self.version
-            + self.inputs_counter
-            + self.get_encoded_inputs(position=range(len(self.inputs)))
-            + self.outputs_counter
-            + self.get_encoded_outputs()
-            + self.lock_time
-        )
-        self.id = reverse_byte_hex(double_sha256(raw_transaction_data).hexdigest())
-        self.raw = raw_transaction_data.hex()
+        if executor is None:
+            for i in range(len(self.inputs)):
+                self.sign_input(i)
+        else:
+            self.sign_inputs(executor)
+        writer = TransactionWriter(self.get_size())
+        writer.write(self.get_encoded_prefix())
+        self.write_inputs(writer, position=range(len(self.inputs)))
+        writer.write(self.outputs_counter)
+        self.write_outputs(writer)
+        writer.write(self.lock_time)
+        self.id = reverse_byte_hex(double_sha256(writer.getbuffer()).hexdigest())
+        self.raw = writer.hex()
         logger.info('Created transaction with id: %s\nRaw data: %s', self.id, self.raw)
         return self.raw
 
@@ -200,42 +313,12 @@ class POSTransaction(Transaction):
             inp['transaction_id'] = reverse_byte_hex(inp['transaction_id'])
         super().__init__(coin, inputs, outputs, **params)
 
-    def get_data_to_sign(self, position):
-        data = (
+    def get_encoded_prefix(self):
+        return (
             # Four-byte version field
             self.version
             # Transaction creation time
             + self.transaction_time
             # One-byte varint specifying the number of inputs
             + self.inputs_counter
-            # Inputs
-            + self.get_encoded_inputs([position])
-            # One-byte varint containing the number of outputs in our new transaction
-            + self.outputs_counter
-            # Outputs
-            + self.get_encoded_outputs()
-            # Four-byte "lock time" field
-            + self.lock_time
-            # Four-byte "hash code type"
-            + self.hash_type
         )
-        return data
-
-    def create(self):
-        if self.id:
-            raise Exception(f'Transaction id {self.id} already created')
-        for i in range(len(self.inputs)):
-            self.sign_input(i)
-        raw_transaction_data = (
-            self.version
-            + self.transaction_time
-            + self.inputs_counter
-            + self.get_encoded_inputs(position=range(len(self.inputs)))
-            + self.outputs_counter
-            + self.get_encoded_outputs()
-            + self.lock_time
-        )
-        self.id = reverse_byte_hex(double_sha256(raw_transaction_data).hexdigest())
-        self.raw = raw_transaction_data.hex()
-        logger.info('Created transaction with id: %s\nRaw data: %s', self.id, self.raw)
-        return self.raw
@@ -6,7 +6,65 @@ from pyqrcode import QRCode
 
 from multicrypto.ellipticcurve import Point, secp256k1
 from multicrypto.numbertheory import modular_sqrt
-from multicrypto.ripemd160 import ripemd160
+from multicrypto.ripemd160 import ripemd160, ripemd160_32_many
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    from Crypto.Hash import RIPEMD160
+except ImportError:  # pragma: no cover
+    RIPEMD160 = None
+
+
+def hashlib_ripemd160(input_data):
+    return hashlib.new('ripemd160', input_data).digest()
+
+
+def pycryptodome_ripemd160(input_data):
+    return RIPEMD160.new(input_data).digest()
+
+
+# RIPEMD-160 implementations in order of preference, pure python one is the last resort
+RIPEMD160_BACKENDS = {
+    'hashlib': hashlib_ripemd160,
+    'pycryptodome': pycryptodome_ripemd160,
+    'python': ripemd160,
+}
+RIPEMD160_EMPTY_DIGEST = bytes.fromhex('9c1185a5c5e9fc54612808977ee8f548b2258d31')
+ripemd160_backend = 'python'
+ripemd160_function = ripemd160
+
+
+def set_ripemd160_backend(name=None):
+    """
+    Select RIPEMD-160 implementation used by hash160. Without name the first working
+    backend from RIPEMD160_BACKENDS is chosen.
+    :param name: Name of the backend from RIPEMD160_BACKENDS
+    :return: Name of the selected backend
+    """
+    global ripemd160_backend, ripemd160_function  # pylint: disable=global-statement
+    for backend_name, function in RIPEMD160_BACKENDS.items():
+        if name is not None and backend_name != name:
+            continue
+        try:
+            if function(b'') != RIPEMD160_EMPTY_DIGEST:
+                continue
+        except (AttributeError, ValueError):  # missing library or unsupported by openssl
+            continue
+        ripemd160_backend, ripemd160_function = backend_name, function
+        return backend_name
+    raise ValueError(f'RIPEMD-160 backend {name} is not available')
+
+
+def get_ripemd160_backend():
+    """Return name of RIPEMD-160 implementation used by hash160"""
+    return ripemd160_backend
+
+
+set_ripemd160_backend()
 
 
 def decode_point(encoded_point, curve=secp256k1):
@@ -27,13 +85,14 @@ def decode_point(encoded_point, curve=secp256k1):
     raise Exception('Unrecognized point format')
 
 
-def encode_point(point, compressed, output_format='bytes'):
+def encode_coordinates(x, y, compressed):
     if compressed:
-        encoded_point = bytes([2 + (point.y % 2)]) + point.x.to_bytes(32, byteorder='big')
-    else:
-        encoded_point = (
-            b'\x04' + point.x.to_bytes(32, byteorder='big') + point.y.to_bytes(32, byteorder='big')
-        )
+        return bytes([2 + (y % 2)]) + x.to_bytes(32, byteorder='big')
+    return b'\x04' + x.to_bytes(32, byteorder='big') + y.to_bytes(32, byteorder='big')
+
+
+def encode_point(point, compressed, output_format='bytes'):
+    encoded_point = encode_coordinates(point.x, point.y, compressed)
     if output_format == 'hex':
         return encoded_point.hex()
     return encoded_point
@@ -58,10 +117,24 @@ def double_sha256(input_data=b''):
 
 def hash160(input_data):
     hash_sha256 = hashlib.sha256(input_data).digest()
-    digest = ripemd160(hash_sha256)
+    digest = ripemd160_function(hash_sha256)
     return digest
 
 
+def hash160_many(inputs_data):
+    """
+    Calculate hash160 of many inputs (i.e. encoded public keys) at once. When numpy is
+    installed RIPEMD-160 of all SHA-256 digests is computed lane parallel on arrays.
+    :param inputs_data: List of bytes
+    :return: List of digests
+    """
+    hashes_sha256 = [hashlib.sha256(input_data).digest() for input_data in inputs_data]
+    if numpy is None or not hashes_sha256:
+        return [ripemd160_function(hash_sha256) for hash_sha256 in hashes_sha256]
+    digests = ripemd160_32_many(b''.join(hashes_sha256))
+    return [digests[i : i + 20] for i in range(0, len(digests), 20)]
+
+
 def encode_script(script):
     return int_to_bytes(len(script), byteorder='little') + script
 
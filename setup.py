@@ -34,10 +34,12 @@ setup(
     keywords='cryptocurrency, address, transaction',
     packages=find_packages(exclude=['htmlcov', 'tests']),
     install_requires=['pypng==0.0.21', 'PyQRCode==1.2.1', 'pycryptodome==3.17', 'requests==2.32.2'],
+    extras_require={'numpy': ['numpy']},
     entry_points={
         'console_scripts': [
             'checkaddress=multicrypto.commands.checkaddress:main',
             'genaddress=multicrypto.commands.genaddress:main',
+            'genethaddress=multicrypto.commands.genethaddress:main',
             'sendcrypto=multicrypto.commands.sendcrypto:main',
             'signmessage=multicrypto.commands.signmessage:main',
             'sweepaddress=multicrypto.commands.sweepaddress:main',
@@ -1,14 +1,26 @@
+import os
+
 import pytest
 
 from multicrypto.address import (
+    calculate_address,
+    calculate_bech32_address,
+    derive_addresses,
+    derive_public_key_data,
+    get_bech32_pattern_digest_ranges,
+    get_pattern_digest_ranges,
     get_private_key_from_wif_format,
     convert_private_key_to_address,
+    convert_public_key_to_address,
     translate_address,
+    validate_bech32_pattern,
     validate_pattern,
     validate_wif_private_key,
+    PatternIndex,
 )
 from multicrypto.base58 import base58
 from multicrypto.coins import coins
+from multicrypto.ellipticcurve import secp256k1
 
 
 def test_convert_private_key_to_address():
@@ -38,8 +50,8 @@ def test_get_private_key_from_wif_format_compressed():
     assert is_compressed is True
 
 
-def test_validate_pattern_success():
-    pattern = '123456'
+@pytest.mark.parametrize("pattern", ['123456', '1R', '1z'])
+def test_validate_pattern_success(pattern):
     coin_symbol = 'BTC'
 
     result = validate_pattern(pattern, coin_symbol, False)
@@ -56,8 +68,8 @@ def test_validate_pattern_raise_no_base58_characters():
     assert str(exc_info.value) == 'pattern containIO contains not allowed characters: IO'
 
 
-def test_validate_pattern_raise_impossible_prefix():
-    pattern = '211'
+@pytest.mark.parametrize("pattern", ['211', '1' * 26])
+def test_validate_pattern_raise_impossible_prefix(pattern):
     coin_symbol = 'BTC'
     btc_range = '1111111111111111111111111-1QLbz7JHiBTspS962RLKV8GndWFwiEaqKL'
     error_message = (
@@ -111,3 +123,125 @@ def test_validate_wif_private_key_uncompressed_failure():
     with pytest.raises(Exception) as exc_info:
         validate_wif_private_key(btc_wif_private_key_uncompressed, 'LTC')
     assert str(exc_info.value) == 'Incorrect secret prefix 0x80 in wif private key for coin LTC'
+
+
+def test_pattern_index_match():
+    pattern_index = PatternIndex(['1A', '1AB', '1B', '1AB'])
+
+    assert len(pattern_index) == 3
+    assert pattern_index.match('1ABCD') == ['1A', '1AB']
+    assert pattern_index.match('1BA') == ['1B']
+    assert pattern_index.match('1CAB') == []
+    assert PatternIndex(['']).match('1CAB') == ['']
+
+
+@pytest.mark.parametrize(
+    "pattern,address_prefix_bytes",
+    [
+        ('1BTC', b'\x00'),
+        ('111', b'\x00'),
+        ('3Ab', b'\x05'),
+        ('t1aa', b'\x1c\xb8'),
+        ('', b'\x30'),
+        ('1' * 26, b'\x00'),
+    ],
+)
+def test_pattern_index_match_digest(pattern, address_prefix_bytes):
+    pattern_index = PatternIndex([pattern], address_prefix_bytes)
+    digests = [os.urandom(20) for _ in range(500)] + [b'\x00' * 20, b'\xff' * 20]
+    for digest in digests:
+        address = calculate_address(digest, address_prefix_bytes)
+        if address.startswith(pattern):
+            assert pattern_index.match_digest(int.from_bytes(digest, byteorder='big'))
+    digest_ranges = get_pattern_digest_ranges(pattern, address_prefix_bytes)
+    if not digest_ranges:  # pattern longer than any address
+        assert pattern_index.match_probability() == 0
+        return
+    # the lowest digest for which address starts with pattern
+    start, _ = digest_ranges[0]
+    digest = (start + 1).to_bytes(20, byteorder='big')
+    assert calculate_address(digest, address_prefix_bytes).startswith(pattern)
+
+
+@pytest.mark.parametrize("compressed,segwit", [(True, False), (False, False), (True, True)])
+def test_derive_addresses(compressed, segwit):
+    coin = coins['BTC']
+    prefix_bytes = coin['script_prefix_bytes'] if segwit else coin['address_prefix_bytes']
+    private_keys = [
+        1,
+        2,
+        7719472615821079694904732333912527190217998977709370935963838933860875309329,
+    ]
+    private_keys += [int.from_bytes(os.urandom(32), byteorder='big') for _ in range(7)]
+
+    addresses = derive_addresses(private_keys, coin, compressed, segwit, batch_size=4)
+
+    assert list(addresses) == [
+        convert_private_key_to_address(private_key, prefix_bytes, compressed, segwit)
+        for private_key in private_keys
+    ]
+
+
+@pytest.mark.parametrize(
+    "patterns,address_prefix_bytes,probability",
+    [(['11'], b'\x00', 1 / 256), (['1A', '1AB'], b'\x00', 1 / 23), (['3'], b'\x05', 1)],
+)
+def test_pattern_index_match_probability(patterns, address_prefix_bytes, probability):
+    pattern_index = PatternIndex(patterns, address_prefix_bytes)
+
+    assert pattern_index.match_probability() == pytest.approx(probability, rel=0.01)
+
+
+def test_calculate_bech32_address():
+    digest = bytes.fromhex('751e76e8199196d454941c45d1b3a323f1433bd6')
+
+    assert calculate_bech32_address(digest, 'bc') == 'bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4'
+
+
+@pytest.mark.parametrize(
+    "pattern,coin_symbol",
+    [
+        ('bc1qmoney', 'BTC'),
+        ('bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv', 'BTC'),
+        ('tb1qzz', 'BTC'),
+        ('bc1q', 'ZEC'),
+    ],
+)
+def test_validate_bech32_pattern_failure(pattern, coin_symbol):
+    with pytest.raises(ValueError):
+        validate_bech32_pattern(pattern, coin_symbol)
+
+
+@pytest.mark.parametrize("pattern", ['bc1q', 'bc1qqqq', 'bc1qw508d6', 'bc1qllll7'])
+def test_get_bech32_pattern_digest_ranges(pattern):
+    validate_bech32_pattern(pattern, 'BTC')
+    ((start, end),) = get_bech32_pattern_digest_ranges(pattern, 'bc')
+
+    for digest in (start, end - 1):
+        assert calculate_bech32_address(digest.to_bytes(20, byteorder='big'), 'bc').startswith(
+            pattern
+        )
+    for digest in (start - 1, end):
+        if 0 <= digest < 2**160:
+            address = calculate_bech32_address(digest.to_bytes(20, byteorder='big'), 'bc')
+            assert not address.startswith(pattern)
+
+
+def test_derive_public_key_data_cached():
+    private_key = 43265286516710475498079662292151387463063605274999989765271924584279496871562
+    derive_public_key_data.cache_clear()
+
+    public_key, encoded_public_keys, public_key_hashes = derive_public_key_data(private_key)
+    cached_data = derive_public_key_data(private_key)
+
+    assert cached_data == (public_key, encoded_public_keys, public_key_hashes)
+    assert derive_public_key_data.cache_info().hits == 1
+    assert public_key == secp256k1.G * private_key
+    assert encoded_public_keys[True].hex() == (
+        '02c0dae3dc13a30b6fc4fbe361a943680148cc028d96d91d6997cbbb572258b308'
+    )
+    assert public_key_hashes[True].hex() == 'b1b685a57154a3c3265b8648101ea6fbba8fad72'
+    for compressed in (False, True):
+        assert calculate_address(public_key_hashes[compressed], b'\x00') == (
+            convert_public_key_to_address(public_key, b'\x00', compressed)
+        )
@@ -106,3 +106,74 @@ multiplication_points_data = [
 @pytest.mark.parametrize("a, b, point_result", multiplication_points_data)
 def test_points_multiplication(a, b, point_result):
     assert a * b == point_result
+
+
+def test_jacobian_multiply_matches_repeated_addition():
+    point = secp256k1.identity_point
+    for multiplier in range(1, 20):
+        point = point + secp256k1.G
+        jacobian_point = secp256k1.jacobian_multiply(secp256k1.G, multiplier)
+        assert secp256k1.from_jacobian(jacobian_point) == point
+
+
+@pytest.mark.parametrize("multiplier", [1, 2, 255, 256, 2**200 + 17, secp256k1.n - 1, secp256k1.n])
+def test_generator_table_multiplication(multiplier):
+    expected = secp256k1.from_jacobian(secp256k1.jacobian_multiply(secp256k1.G, multiplier))
+    jacobian_point = secp256k1.jacobian_multiply_generator(multiplier)
+    assert secp256k1.from_jacobian(jacobian_point) == expected
+
+
+@pytest.mark.parametrize("window_bits", [1, 2, 5])
+def test_multiply_two(window_bits):
+    point1 = secp256k1.G * 0xC0FFEE
+    point2 = secp256k1.G * 10**50
+    multiplier1 = 0x1234567890ABCDEF1234567890ABCDEF1234567890ABCDEF
+    multiplier2 = -(10**70)
+    jacobian_point = secp256k1.jacobian_multiply_two(
+        point1, multiplier1, point2, multiplier2, window_bits
+    )
+    assert secp256k1.from_jacobian(jacobian_point) == point1 * multiplier1 + point2 * multiplier2
+    assert secp256k1.multiply_two(secp256k1.G, 7, point2, 0) == secp256k1.G * 7
+
+
+def test_endomorphism_split():
+    endomorphism = secp256k1.endomorphism
+    for multiplier in [1, 2**128, secp256k1.n - 1, 10**76, 0xDEADBEEF * 2**200]:
+        multiplier1, multiplier2 = endomorphism.split(multiplier, secp256k1.n)
+        assert (multiplier1 + multiplier2 * endomorphism.lam - multiplier) % secp256k1.n == 0
+        assert abs(multiplier1).bit_length() <= 129
+        assert abs(multiplier2).bit_length() <= 129
+
+
+def test_endomorphism_multiplication():
+    point = secp256k1.G * 10**30
+    for multiplier in [3, 2**255 + 7, secp256k1.n - 2, secp256k1.endomorphism.lam]:
+        expected = secp256k1.from_jacobian(secp256k1.jacobian_multiply(point, multiplier))
+        assert point * multiplier == expected
+
+
+@pytest.mark.parametrize("multiplier", [5, secp256k1.n - 3])
+def test_walk_points(multiplier):
+    point = secp256k1.G * multiplier
+    walk = secp256k1.walk_points(point, secp256k1.G, batch_size=4)
+    for _ in range(10):
+        assert next(walk) == (point.x, point.y)
+        point = point + secp256k1.G
+
+
+def test_point_validation():
+    with pytest.raises(Exception):
+        Point(secp256k1, secp256k1.gx, secp256k1.gy + 1)
+    point = Point.from_trusted(secp256k1, secp256k1.gx, secp256k1.gy)
+    assert point == secp256k1.G
+    assert not hasattr(point, '__dict__')
+
+
+def test_identity_point_is_shared_and_not_modified():
+    point = secp256k1.identity_point
+    assert point is secp256k1.identity_point
+    point += secp256k1.G
+    point *= 2
+    assert point == secp256k1.G * 2
+    assert secp256k1.identity_point.x == secp256k1.identity_point.y == 0
+    assert secp256k1.G.x == secp256k1.gx and secp256k1.G.y == secp256k1.gy
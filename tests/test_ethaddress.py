@@ -1,6 +1,12 @@
 import pytest
 
-from multicrypto.ethaddress import to_checksum_address
+from multicrypto.ellipticcurve import secp256k1
+from multicrypto.ethaddress import (
+    convert_public_key_to_address,
+    get_pattern_mask,
+    to_checksum_address,
+    validate_pattern,
+)
 
 valid_checksum_eth_addresses = [
     '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed',
@@ -27,14 +33,52 @@ def test_invalid_checksum_eth_addresses(address):
         assert address == to_checksum_address(address)
 
 
-# Private key: eff415edb6331f4f67bdb7f1ecc639da9bcc0550b100bb275c7b5b21ce3a7804
-# Public key:  d6dd5241c03bf418b333c256057ee878c34975d6abda075d58e4b9780f4a8659fcc096b6ad763d8e5914f7daa0b7351398b1eb6458e95ac41a2711a0651f3fc6
-# Address:     0x4206f95fc533483fae4687b86c1d0a0088e3cd48
+@pytest.mark.parametrize(
+    "private_key,address",
+    [
+        (
+            'eff415edb6331f4f67bdb7f1ecc639da9bcc0550b100bb275c7b5b21ce3a7804',
+            '0x4206f95fc533483fae4687b86c1d0a0088e3cd48',
+        ),
+        (
+            '9442b4b82c8011530f3a363cc87a4ea91efd53552faab2e63fd352db9367bb24',
+            '0x083c41ea13af6c2d5aaddf6e73142eb9a7b00183',
+        ),
+        (
+            '981679905857953c9a21e1807aab1b897a395ea0c5c96b32794ccb999a3cd781',
+            '0x5fe3062B24033113fbf52b2b75882890D7d8CA54',
+        ),
+    ],
+)
+def test_convert_public_key_to_address(private_key, address):
+    public_key = secp256k1.G * int(private_key, 16)
 
-# Private key: 9442b4b82c8011530f3a363cc87a4ea91efd53552faab2e63fd352db9367bb24
-# Public key:  3f538de115393e2a8851b4c19f686b6bb245213c3823e69336583f1d72c53d20831ea0574900b31d833932b3e8e71b4e99d574c6480890d60153fc2dccbc96d6
-# Address:     0x083c41ea13af6c2d5aaddf6e73142eb9a7b00183
+    assert convert_public_key_to_address(public_key) == address.lower()
+    assert convert_public_key_to_address(public_key, with_check_sum=True) == to_checksum_address(
+        address
+    )
 
-# Private key: 981679905857953c9a21e1807aab1b897a395ea0c5c96b32794ccb999a3cd781
-# Public key:  7454f003941bba7c5e16d8c9fce19104b2f51486e00d47f39e6eb0aea6f1c6f80cad2d239c8b4b1bf903e41960920f735fda4fcc4422aa815416b7d0df62f8a5
-# Address:     0x5fe3062B24033113fbf52b2b75882890D7d8CA54
+
+@pytest.mark.parametrize(
+    "prefix,suffix,address,matches",
+    [
+        ('dead', '', '0xdead3b407c01e7cd3cbea99509d93f8dddc8c6fb', True),
+        ('DEAD', 'beef', '0xdead3b407c01e7cd3cbea99509d93f8dddc8beef', True),
+        ('', '00', '0x5aaeb6053f3e94c9b9a09f33669435e7ef1bea00', True),
+        ('dead', '', '0xdeae3b407c01e7cd3cbea99509d93f8dddc8c6fb', False),
+        ('dead', 'beef', '0xdead3b407c01e7cd3cbea99509d93f8dddc8beee', False),
+        ('', '', '0x5aaeb6053f3e94c9b9a09f33669435e7ef1bea00', True),
+    ],
+)
+def test_get_pattern_mask(prefix, suffix, address, matches):
+    mask, value = get_pattern_mask(prefix.lower(), suffix.lower())
+
+    assert (int(address, 16) & mask == value) is matches
+
+
+@pytest.mark.parametrize(
+    "prefix,suffix", [('0xab', ''), ('abg', ''), ('', '-1'), ('a' * 30, 'b' * 11)]
+)
+def test_validate_pattern_failure(prefix, suffix):
+    with pytest.raises(ValueError):
+        validate_pattern(prefix, suffix)
@@ -1,3 +1,4 @@
+import json
 import os
 import random
 import sys
@@ -6,11 +7,31 @@ from unittest.mock import patch
 
 import pytest
 
-from multicrypto.address import get_address_range
+from multicrypto.address import (
+    PatternIndex,
+    calculate_bech32_address,
+    calculate_public_key_hash,
+    convert_wif_private_key_to_address,
+    get_address_range,
+    get_private_key_from_wif_format,
+)
 from multicrypto.base58 import base58
 from multicrypto.coins import coins
-from multicrypto.commands.genaddress import generate_address, main
+from multicrypto.commands.genaddress import (
+    WorkerPool,
+    estimate_search,
+    find_addresses,
+    generate_address,
+    main,
+    measure_key_rate,
+    print_stats,
+)
 from multicrypto.consts import OP_EQUAL, OP_16, OP_ADD, OP_15
+from multicrypto.ellipticcurve import secp256k1
+
+
+def failing_worker(**kwargs):
+    raise RuntimeError('worker failure')
 
 
 class SetMock:
@@ -76,3 +97,202 @@ def test_custom_p2sh_address_success(sys_stdout):
     res = '2NBqJfmzsEbbT1YFyCjdU4KYXQajLffLBLM\n'
 
     assert sys_stdout.getvalue() == res
+
+
+@pytest.mark.parametrize("patterns", [['1A', '1B', '1C', '1D'], ['1A', '1A']])
+@patch('sys.stdout', new_callable=StringIO)
+def test_generate_address_many_patterns(sys_stdout, patterns):
+    result = generate_address(
+        worker_num=0,
+        coin_settings=coins['BTC'],
+        pattern=patterns,
+        compressed=True,
+        segwit=False,
+        out_dir=None,
+        found=SetMock(),
+        stop=SetMock(iterations=5),
+        verbose=True,
+    )
+
+    address, private_key = result
+    assert address[:2] in patterns
+    found_addresses = [
+        line[len('Address: ') :]
+        for line in sys_stdout.getvalue().splitlines()
+        if line.startswith('Address: ')
+    ]
+    assert len(found_addresses) > 1
+    assert all(found_address[:2] in patterns for found_address in found_addresses)
+
+
+@patch('sys.stdout', new_callable=StringIO)
+def test_generate_address_checkpoint(sys_stdout, tmpdir):
+    checkpoint_file = os.path.join(tmpdir.strpath, 'worker_0.json')
+    kwargs = dict(
+        worker_num=0,
+        coin_settings=coins['BTC'],
+        pattern=['1A', '1B'],
+        compressed=True,
+        segwit=False,
+        out_dir=None,
+        found=SetMock(),
+        start=5,
+        stride=3,
+        checkpoint_file=checkpoint_file,
+        checkpoint_interval=1000,
+    )
+    counters = [0]
+    generate_address(stop=SetMock(iterations=3), counters=counters, **kwargs)
+
+    assert counters == [3072]
+
+    with open(checkpoint_file) as f:
+        assert json.load(f) == {'start': 5, 'stride': 3, 'offset': 3072}
+    assert os.stat(checkpoint_file).st_mode & 0o777 == 0o600
+
+    sys_stdout.truncate(0)
+    address, wif_private_key = generate_address(stop=SetMock(iterations=1), **kwargs)
+
+    private_key, _ = get_private_key_from_wif_format(wif_private_key)
+    assert private_key % 3 == 5 % 3
+    assert private_key >= 5 + 3072 * 3
+    assert convert_wif_private_key_to_address(wif_private_key, b'\x00') == address
+    with open(checkpoint_file) as f:
+        assert json.load(f)['offset'] == 3072 + 1024
+
+
+def test_generate_address_checkpoint_other_keyspace(tmpdir):
+    checkpoint_file = os.path.join(tmpdir.strpath, 'worker_0.json')
+    with open(checkpoint_file, 'w') as f:
+        json.dump({'start': 5, 'stride': 3, 'offset': 3000}, f)
+
+    with pytest.raises(ValueError):
+        generate_address(
+            worker_num=0,
+            coin_settings=coins['BTC'],
+            pattern='1A',
+            compressed=True,
+            segwit=False,
+            out_dir=None,
+            found=SetMock(),
+            stop=SetMock(),
+            start=5,
+            stride=4,
+            checkpoint_file=checkpoint_file,
+        )
+
+
+def test_start_workers_checkpoint_other_keyspace(tmpdir, caplog):
+    checkpoint_file = os.path.join(tmpdir.strpath, 'worker_0.json')
+    with open(checkpoint_file, 'w') as f:
+        json.dump({'start': 4096, 'stride': 2, 'offset': 3000}, f)
+    argv = ['', '-p', '1A', '-s', 'BTC', '--start', '0x1000', '--checkpoint_dir', tmpdir.strpath]
+
+    with patch.object(sys, 'argv', argv):
+        main()
+
+    assert 'was created for different keyspace partitioning' in caplog.text
+
+
+@pytest.mark.parametrize(
+    "options,error",
+    [
+        (['-c', '0'], 'Number of cores must be at least 1'),
+        (['--checkpoint_interval', '0'], 'Checkpoint interval must be at least 1'),
+        (['--stats_interval', '-1'], 'Statistics interval can not be negative'),
+    ],
+)
+def test_start_workers_invalid_keyspace(tmpdir, caplog, options, error):
+    argv = ['', '-p', '1AB', '-s', 'BTC', '--checkpoint_dir', tmpdir.strpath] + options
+
+    with patch.object(sys, 'argv', argv):
+        main()
+
+    assert error in caplog.text
+
+
+@patch('sys.stdout', new_callable=StringIO)
+def test_print_stats(sys_stdout):
+    print_stats([3000000, 2000000], [1000000, 1000000], 10, 1 / 2**32)
+
+    assert sys_stdout.getvalue() == (
+        'checked 5.0M addresses (300000/sec), expected time to match: 3:58:37, '
+        'slowest worker: 1 (100000/sec), fastest worker: 0 (200000/sec), skew: 66.7%\n'
+    )
+
+
+@patch('sys.stdout', new_callable=StringIO)
+def test_estimate_search(sys_stdout):
+    pattern_index = PatternIndex(['11111'], b'\x00')
+
+    expected_time = estimate_search(pattern_index, key_rate=2**30, cores=4, max_time=1)
+
+    assert expected_time == 1
+    assert sys_stdout.getvalue() == (
+        'Probability of match: 1 in 4,294,967,296, expected time: 0:00:01 '
+        'using 4 cores (1073741824 keys/sec per core)\n'
+    )
+
+
+@pytest.mark.parametrize("key_rate,cores", [(1000, 0), (0, 1)])
+def test_estimate_search_invalid_arguments(key_rate, cores):
+    pattern_index = PatternIndex(['1BTC'], b'\x00')
+
+    with pytest.raises(ValueError):
+        estimate_search(pattern_index, key_rate, cores)
+
+
+def test_estimate_search_exceeds_max_time():
+    pattern_index = PatternIndex(['1BTC', '1ETH'], b'\x00')
+    key_rate = measure_key_rate(pattern_index, compressed=True, segwit=False, keys=100)
+
+    with pytest.raises(ValueError):
+        estimate_search(pattern_index, key_rate / 10**6, cores=1, max_time=1)
+
+
+@pytest.mark.parametrize(
+    "patterns,timeout,min_results", [(['1A'], None, 1), (['1AA', '1AB', '1AC'], 1, 2)]
+)
+def test_find_addresses(capfd, patterns, timeout, min_results):
+    found_addresses = find_addresses(patterns, 'BTC', cores=2, timeout=timeout)
+
+    assert 'Private key' not in capfd.readouterr().out
+    assert len(found_addresses) >= min_results
+    for address, wif_private_key in found_addresses:
+        assert any(address.startswith(pattern) for pattern in patterns)
+        assert convert_wif_private_key_to_address(wif_private_key, b'\x00') == address
+
+
+@pytest.mark.parametrize("patterns", [['10'], ['1' * 26], []])
+def test_find_addresses_invalid_pattern(patterns):
+    with pytest.raises(ValueError):
+        find_addresses(patterns, 'BTC')
+
+
+@pytest.mark.parametrize("coin_symbol,pattern", [('BTC', 'bc1qxy'), ('TBTC', 'tb1qqq')])
+def test_generate_bech32_address(coin_symbol, pattern):
+    address, wif_private_key = generate_address(
+        worker_num=0,
+        coin_settings=coins[coin_symbol],
+        pattern=pattern,
+        compressed=True,
+        segwit=False,
+        out_dir=None,
+        found=SetMock(),
+        stop=SetMock(),
+        bech32=True,
+    )
+
+    private_key, _ = get_private_key_from_wif_format(wif_private_key)
+    digest = calculate_public_key_hash(secp256k1.G * private_key)
+    assert address.startswith(pattern)
+    assert address == calculate_bech32_address(digest, coins[coin_symbol]['bech32_hrp'])
+
+
+def test_worker_pool_wait_for_failed_workers(caplog):
+    with WorkerPool(failing_worker, [{}, {}]) as pool:
+        assert pool.wait() is True
+
+    assert not pool.found.is_set()
+    assert len(pool.failed_workers) == 2
+    assert 'exited with code 1' in caplog.text
@@ -0,0 +1,40 @@
+import multiprocessing
+import sys
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from multicrypto.commands.genethaddress import generate_eth_address, main
+from multicrypto.ellipticcurve import secp256k1
+from multicrypto.ethaddress import convert_public_key_to_address
+
+
+@pytest.mark.parametrize("prefix,suffix", [('ab', ''), ('', 'Cd'), ('e', 'f')])
+@patch('sys.stdout', new_callable=StringIO)
+def test_generate_eth_address(sys_stdout, prefix, suffix):
+    found = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    address, private_key = generate_eth_address(
+        worker_num=0,
+        prefix=prefix,
+        suffix=suffix,
+        found=found,
+        stop=multiprocessing.Event(),
+        results=results,
+        verbose=True,
+    )
+
+    assert address[2:].startswith(prefix.lower())
+    assert address.endswith(suffix.lower())
+    assert convert_public_key_to_address(secp256k1.G * int(private_key, 16)) == address
+    assert found.is_set()
+    assert results.get(timeout=1) == (address, private_key)
+    assert sys_stdout.getvalue() == f'Address: {address}\nPrivate key: {private_key}\n'
+
+
+@patch.object(sys, 'argv', ['', '-p', 'ab', '--stats_interval', '-1'])
+def test_main_negative_stats_interval(caplog):
+    main()
+
+    assert 'Statistics interval can not be negative' in caplog.text
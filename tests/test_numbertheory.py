@@ -3,7 +3,7 @@ from random import randint
 import pytest
 
 from multicrypto.ellipticcurve import secp256k1
-from multicrypto.numbertheory import modular_inverse, modular_sqrt
+from multicrypto.numbertheory import batch_modular_inverse, modular_inverse, modular_sqrt
 
 
 def test_modular_inverse():
@@ -54,3 +54,14 @@ def test_modular_sqrt_no_existing(a, p):
     sqrt = modular_sqrt(a, p)
 
     assert sqrt == 0
+
+
+def test_batch_modular_inverse():
+    n = secp256k1.n
+    values = [randint(1, n - 1) for _ in range(50)] + [0, n]
+    inverses = batch_modular_inverse(values, n)
+    assert inverses[-2:] == [0, 0]
+    for value, inverse in zip(values[:-2], inverses[:-2]):
+        assert value * inverse % n == 1
+    assert batch_modular_inverse([3], 7) == [5]
+    assert batch_modular_inverse([], 7) == []
@@ -1,6 +1,13 @@
 import pytest
 
-from multicrypto.ripemd160 import ripemd160
+from multicrypto.ripemd160 import (
+    RMD160Final,
+    RMD160Update,
+    RMDContext,
+    ripemd160,
+    ripemd160_32,
+    ripemd160_32_many,
+)
 
 
 ripemd160_string_test_data = [
@@ -23,3 +30,22 @@ ripemd160_string_test_data = [
 @pytest.mark.parametrize("data, ripemd160_hash_value", ripemd160_string_test_data)
 def test_ripemd160(data, ripemd160_hash_value):
     assert ripemd160(data.encode()).hex() == ripemd160_hash_value
+
+
+def test_ripemd160_32_bytes_fast_path():
+    data = bytes(range(32))
+    ctx = RMDContext()
+    RMD160Update(ctx, data[:5], 5)
+    RMD160Update(ctx, data[5:], 27)
+
+    assert ripemd160_32(data) == RMD160Final(ctx)
+    assert ripemd160(data).hex() == 'e6babb9619d7a81272711fc546a16b211dd93957'
+
+
+def test_ripemd160_32_many():
+    pytest.importorskip('numpy')
+    messages = [bytes([i]) * 32 for i in range(5)]
+
+    digests = ripemd160_32_many(b''.join(messages))
+
+    assert [digests[i * 20 : (i + 1) * 20] for i in range(5)] == [ripemd160(m) for m in messages]
@@ -0,0 +1,19 @@
+import hashlib
+
+import pytest
+
+from multicrypto.serialization import TransactionWriter
+
+
+@pytest.mark.parametrize("size", [0, 3, 6, 10])
+def test_transaction_writer(size):
+    writer = TransactionWriter(size)
+    writer.write(b'\x01\x02')
+    writer.write(bytearray(b'\x03'))
+    writer.write(b'')
+    writer.write(b'\x04\x05\x06')
+
+    assert len(writer) == 6
+    assert writer.getvalue() == b'\x01\x02\x03\x04\x05\x06'
+    assert writer.hex() == '010203040506'
+    assert hashlib.sha256(writer.getbuffer()).digest() == hashlib.sha256(writer.getvalue()).digest()
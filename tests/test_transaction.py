@@ -1,12 +1,15 @@
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import patch
 
+import pytest
+
 from multicrypto.coins import coins
 from multicrypto.consts import OP_CHECKSIG, OP_DUP, OP_EQUALVERIFY, OP_HASH160, OP_PUSH_20
 from multicrypto.ecdsa import verify
 from multicrypto.ellipticcurve import Point, secp256k1
 from multicrypto.ripemd160 import ripemd160
-from multicrypto.transaction import Transaction, POSTransaction
+from multicrypto.transaction import Transaction, TransactionInput, POSTransaction
 from multicrypto.utils import double_sha256, encode_point, reverse_byte_hex
 
 
@@ -346,7 +349,8 @@ def test_p2sh_transaction_two_inputs_one_p2sh_output():
     assert transaction.id == '3cea520f927772019bc011df7804aebf5826ece7d78ca3f92bbb798c72e13e30'
 
 
-def test_p2sh_transaction_two_p2sh_and_two_pk2sh_inputs__one_p2sh_output():
+@pytest.mark.parametrize("parallel", [False, True])
+def test_p2sh_transaction_two_p2sh_and_two_pk2sh_inputs__one_p2sh_output(parallel):
     """Bitcoin Test transaction 137aa91ff8e7de97cbdb2839580c726c2e11d17a8c204d6c049a178ee122e53d
     locking script OP_1 OP_ADD OP_1 OP_ADD OP_4 OP_EQUAL
     redeem script OP_2
@@ -400,10 +404,84 @@ def test_p2sh_transaction_two_p2sh_and_two_pk2sh_inputs__one_p2sh_output():
     outputs = [{'address': '2NBkdAqJSFQR5SzHmiekWVRLxzfLsSYiFZ2', 'satoshis': 480000}]
 
     transaction = Transaction(coin=coins['TBTC'], inputs=inputs, outputs=outputs)
-    transaction.create()
+    if parallel:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            transaction.create(executor=executor)
+    else:
+        transaction.create()
 
     assert transaction.raw == raw_transaction
     assert transaction.id == '137aa91ff8e7de97cbdb2839580c726c2e11d17a8c204d6c049a178ee122e53d'
+    assert transaction.get_size() == len(raw_transaction) // 2
+
+
+def test_data_to_sign_many_inputs_with_history_block():
+    inputs = [
+        {
+            'transaction_id': f'{i:064x}',
+            'output_index': i,
+            'locking_script': '76a914759d667709c9d1fbd7aa26537b5c441747d88f2588ac',
+            'private_key': i + 1,
+            'satoshis': 1000 + i,
+        }
+        for i in range(5)
+    ]
+    outputs = [{'address': '1Bitcoinmw2Ui5A547MRjgnGi1Pk25jBzi', 'satoshis': 4000}]
+    history_block = {'hash': 'ab' * 32, 'height': 500000}
+    transaction = Transaction(
+        coin=coins['BTC'], inputs=inputs, outputs=outputs, check_block_at_height=history_block
+    )
+    output_script = (
+        bytes.fromhex('76a914759d667709c9d1fbd7aa26537b5c441747d88f2588ac')
+        + b'\x20'
+        + bytes.fromhex('ab' * 32)
+        + b'\x03\x20\xa1\x07\xb4'
+    )
+    encoded_outputs = b'\x01' + (4000).to_bytes(8, 'little') + b'\x3f' + output_script
+
+    for position in range(len(inputs)):
+        encoded_inputs = b''.join(
+            bytes.fromhex(f'{i:064x}')
+            + i.to_bytes(4, 'little')
+            + (
+                b'\x19' + bytes.fromhex('76a914759d667709c9d1fbd7aa26537b5c441747d88f2588ac')
+                if i == position
+                else b'\x00'
+            )
+            + b'\xff\xff\xff\xff'
+            for i in range(len(inputs))
+        )
+        data = (
+            b'\x01\x00\x00\x00\x05'
+            + encoded_inputs
+            + encoded_outputs
+            + b'\x00\x00\x00\x00'
+            + b'\x01\x00\x00\x00'
+        )
+        assert transaction.get_data_to_sign(position) == data
+        transaction.sign_input(position)
+        assert transaction.get_data_to_sign(position) == data
+
+
+def test_transaction_input_derived_fields():
+    private_key = 43265286516710475498079662292151387463063605274999989765271924584279496871562
+    inp = TransactionInput(
+        transaction_id='999422d4e2a72c7bd5890922129498b7b0e68141aadb6ec920b6baee57e2586a',
+        output_index=1,
+        locking_script='76a914b1b685a57154a3c3265b8648101ea6fbba8fad7288ac',
+        satoshis=10892722,
+        private_key=private_key,
+        unlocking_script='',
+    )
+
+    assert not hasattr(inp, '__dict__')
+    assert inp.public_key == secp256k1.G * private_key
+    assert inp.public_key_len == b'\x21'
+    assert inp.encoded_public_key == encode_point(inp.public_key, compressed=True)
+    assert inp.script_length == b'\x19'
+    assert inp.get_encoded(with_script=False).hex() == (
+        '999422d4e2a72c7bd5890922129498b7b0e68141aadb6ec920b6baee57e2586a0100000000'
+    )
 
 
 # @patch('multicrypto.transaction.sign')
@@ -9,6 +9,11 @@ from multicrypto.utils import (
     decode_point,
     encode_point,
     int_to_varint_hex,
+    get_ripemd160_backend,
+    hash160,
+    hash160_many,
+    set_ripemd160_backend,
+    RIPEMD160_BACKENDS,
 )
 
 
@@ -82,3 +87,29 @@ integer_data = [
 @pytest.mark.parametrize("integer, varint_hex", integer_data)
 def test_int_to_varint_hex(integer, varint_hex):
     assert int_to_varint_hex(integer) == varint_hex
+
+
+@pytest.mark.parametrize("backend", list(RIPEMD160_BACKENDS))
+def test_hash160_backends(backend):
+    selected_backend = get_ripemd160_backend()
+    try:
+        try:
+            set_ripemd160_backend(backend)
+        except ValueError:
+            pytest.skip(f'RIPEMD-160 backend {backend} is not available')
+        assert get_ripemd160_backend() == backend
+        assert hash160(b'Hello world').hex() == 'f5e95668dadf6fdef8521f7e1aa8a5e650c9f849'
+    finally:
+        set_ripemd160_backend(selected_backend)
+
+
+def test_set_unknown_ripemd160_backend():
+    with pytest.raises(ValueError):
+        set_ripemd160_backend('unknown')
+
+
+def test_hash160_many():
+    inputs_data = [encode_point(secp256k1.G * i, compressed=i % 2 == 0) for i in range(1, 20)]
+
+    assert hash160_many(inputs_data) == [hash160(input_data) for input_data in inputs_data]
+    assert hash160_many([]) == []